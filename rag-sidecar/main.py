@@ -6,38 +6,61 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import hashlib
+import inspect
 import io
-import json
 import logging
-import math
+import multiprocessing
 import os
 import re
+import shutil
+import threading
 import time
-from datetime import datetime
+from collections import Counter, OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from statistics import fmean
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import urllib.request
-import urllib.error
+import httpx
 import numpy as np
+import orjson
 import bm25s
 import pymupdf
 from sentence_transformers import SentenceTransformer
-from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
+from fastapi import BackgroundTasks, Depends, FastAPI, File, HTTPException, Request, Response, UploadFile
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 import uvicorn
 try:
     from groq import Groq, RateLimitError
     _GROQ_AVAILABLE = True
 except ImportError:
     _GROQ_AVAILABLE = False
+try:
+    import fcntl  # POSIX only — without it scoring and cache builds are guarded per process
+except ImportError:
+    fcntl = None
+try:
+    from numba import njit  # optional: fused voter-filter kernel
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
 # ─── Logging ──────────────────────────────────────────────────────────────────
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s  %(levelname)s  %(message)s")
+# LOG_LEVEL=DEBUG brings back the per-result dump in /retrieve
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+                    format="%(asctime)s  %(levelname)s  %(message)s")
 log = logging.getLogger("rag-sidecar")
 
 # ─── Config ───────────────────────────────────────────────────────────────────
@@ -50,14 +73,42 @@ CHUNK_SIZE     = 280   # words per chunk — pplx-embed handles long context, ke
 OVERLAP        = 60    # word overlap between adjacent chunks — more overlap to avoid splitting facts
 MIN_CHUNK_WORDS = 40   # skip pages shorter than this
 FINAL_TOP_K    = 15    # return more chunks so factual answers aren't missed
+RESCUE_MAX_SCORE = 0.75  # keyword rescue only runs when the top fused score is below this
+# Dense index storage: "float32" (default, fastest BLAS scan) or "int8" (4× less RAM —
+# NumPy has no int8 BLAS, so the scan is somewhat slower; worth it for large corpora)
+EMBED_QUANTIZATION = os.environ.get("EMBED_QUANTIZATION", "float32")
+# encode() already length-sorts its input (smart batching), so batches pad little
+# and can be larger than the old fixed 16 / 8
+EMBED_BATCH_SIZE      = 64
+PAGE_EMBED_BATCH_SIZE = 32   # full pages — longer sequences per row
+# Bi-encoder runtime: "torch" (default) or "onnx" — a dynamically int8-quantized
+# ONNX export served by ONNX Runtime (needs `sentence-transformers[onnx]`;
+# exported once into ONNX_DIR, falls back to PyTorch if anything fails)
+EMBED_BACKEND      = os.environ.get("EMBED_BACKEND", "torch")
+ONNX_DIR           = CACHE_DIR / "onnx-model"
+ONNX_QUANTIZATION  = os.environ.get("ONNX_QUANTIZATION", "avx512_vnni")   # arm64 | avx2 | avx512 | avx512_vnni
+# Past this many chunks, dense search first shortlists by Hamming distance over
+# 1-bit sign codes and only computes cosine for the nearest DENSE_SHORTLIST rows
+DENSE_PREFILTER_MIN = 20000
+DENSE_SHORTLIST     = 200
 # ── Local Ollama config (primary LLM backend) ────────────────────────────────
 OLLAMA_URL       = os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434")
 OLLAMA_MODEL     = os.environ.get("OLLAMA_MODEL", "llama3.1:8b-instruct-q4_K_M")
+# Keep the model (and the KV cache of its last prompt) resident between calls
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE", "30m")
 # ── Groq config (optional cloud fallback) ─────────────────────────────────────
 GROQ_MODEL       = "llama-3.1-8b-instant"
 GROQ_MAX_RETRIES = 2    # fewer retries now that Ollama is primary
 GROQ_BASE_DELAY  = 1.0  # seconds
 
+# PDFs whose chunk cache is cold are ingested this many at a time, each worker
+# process with its own embedder — size this to RAM as well
+INGEST_WORKERS   = int(os.environ.get("INGEST_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+
+# uvicorn worker processes.  Voter state is shared through the on-disk cache;
+# every worker loads its own embedder + RAG index, so size this to RAM
+SIDECAR_WORKERS  = int(os.environ.get("SIDECAR_WORKERS", "1"))
+
 _ollama_available: Optional[bool] = None  # cached, rechecked periodically
 _ollama_checked_at: float = 0.0
 
@@ -66,7 +117,7 @@ CACHE_DIR.mkdir(exist_ok=True)
 
 # ─── FastAPI app ──────────────────────────────────────────────────────────────
 
-app = FastAPI(title="CivIQ RAG Sidecar", version="2.0.0")
+app = FastAPI(title="CivIQ RAG Sidecar", version="2.0.0", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
@@ -77,15 +128,83 @@ app.add_middleware(
 # ─── Global in-memory index ───────────────────────────────────────────────────
 
 embedder: Optional[SentenceTransformer] = None
-chunks:   List[dict] = []          # all indexed chunks across all docs
-bm25_index: Optional[bm25s.BM25] = None
-# Page-level index for fallback retrieval (rescues answers missed by chunks)
-pages_store:    List[dict] = []    # full page text + embeddings
-pages_bm25:     Optional[bm25s.BM25] = None
+embed_backend: str = "torch"       # runtime the loaded embedder actually uses
+
+
+@dataclass(frozen=True, eq=False)
+class _ChunkIndex:
+    """
+    Every row-aligned structure retrieval reads (row i ↔ chunks[i]), plus the
+    page-level index.  Rebuilt whole by ingest_all_docs and published by a
+    single assignment to `_index`, so a search that binds `_index` once never
+    mixes rows of two corpora even if a re-ingest lands mid-search.
+    """
+    version: int = 0               # bumped each time ingest_all_docs publishes a corpus
+    chunks:  List[dict] = field(default_factory=list)   # all indexed chunks across all docs
+    bm25_index: Optional[bm25s.BM25] = None
+    # Page-level index for fallback retrieval (rescues answers missed by chunks)
+    pages_store: List[dict] = field(default_factory=list)   # full page text + embeddings
+    pages_bm25:  Optional[bm25s.BM25] = None
+    # Lookups rebuilt with the index so retrieval never rescans `chunks`:
+    #   chunk id → chunks (ids restart per document, so one id can map to several)
+    #   (doc_id, page) → chunks on that page, used by page-level rescue
+    chunks_by_id:   Dict[str, List[dict]] = field(default_factory=dict)
+    chunks_by_page: Dict[tuple, List[dict]] = field(default_factory=dict)
+    chunk_ids: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=object))   # row i → chunks[i]["id"]
+    # Fusion works per distinct id ("key"): row → key, key → row of its last chunk
+    # (the one id lookups resolve to), key → number of chunks sharing it
+    chunk_key:       np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    chunk_key_row:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    chunk_key_count: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    chunk_key_by_id: Dict[str, int] = field(default_factory=dict)   # chunk id → key
+    # Keyword-boost postings: lowercased time expression / standalone number →
+    # ascending rows whose raw_content contains it
+    chunk_time_rows: Dict[str, np.ndarray] = field(default_factory=dict)
+    chunk_num_rows:  Dict[str, np.ndarray] = field(default_factory=dict)
+    # Keyword-rescue index over each chunk's combined_lower: every distinct
+    # _QUERY_WORD_RE token, "\n"-joined into one string (so a query word can be
+    # substring-matched against the whole vocabulary at once), each token's start
+    # offset in it, and its ascending postings rows
+    rescue_vocab:        str = ""
+    rescue_vocab_starts: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    rescue_postings:     List[np.ndarray] = field(default_factory=list)
+    # Per-row pattern hits behind the static score adjustments (see hybrid_search)
+    chunk_has_time:      np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    chunk_has_phone:     np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    chunk_low_title:     np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    chunk_low_content:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    chunk_closing_title: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    # Row-stacked, L2-normalized embeddings (row i ↔ chunks[i] / pages_store[i]);
+    # cosine against every row is one matrix-vector product.  With int8
+    # quantization the matrix is int8 and *_emb_scale holds each row's scale.  The
+    # chunk matrices are memory-mapped from CACHE_DIR (see cached_dense_index)
+    chunk_emb_matrix: Optional[np.ndarray] = None
+    chunk_emb_scale:  Optional[np.ndarray] = None
+    chunk_emb_bits:   Optional[np.ndarray] = None   # np.packbits(row > 0) — 1 bit per dim; None below DENSE_PREFILTER_MIN
+    pages_emb_matrix: Optional[np.ndarray] = None
+    pages_emb_scale:  Optional[np.ndarray] = None
+
+
+_index = _ChunkIndex()
 _ingesting = False                 # guard against concurrent /ingest calls
 
 # ─── Ollama (local, primary LLM) ─────────────────────────────────────────────
 
+_ollama_client: Optional[httpx.Client] = None
+_ollama_client_pid = 0
+
+def ollama_client() -> httpx.Client:
+    """Keep-alive connection pool to Ollama, one per process (not fork-safe)."""
+    global _ollama_client, _ollama_client_pid
+    if _ollama_client is None or _ollama_client_pid != os.getpid():
+        _ollama_client = httpx.Client(
+            base_url=OLLAMA_URL, timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
+        _ollama_client_pid = os.getpid()
+    return _ollama_client
+
+
 def is_ollama_up() -> bool:
     """Check if Ollama is running and the target model is available."""
     global _ollama_available, _ollama_checked_at
@@ -94,17 +213,16 @@ def is_ollama_up() -> bool:
         return _ollama_available
     _ollama_checked_at = time.time()
     try:
-        req = urllib.request.Request(f"{OLLAMA_URL}/api/tags")
-        with urllib.request.urlopen(req, timeout=2) as r:
-            data = json.loads(r.read())
-            models = [m["name"] for m in data.get("models", [])]
-            # Accept partial match (e.g. "llama3.2:3b" matches "llama3.2:3b-instruct-q4_K_M")
-            base = OLLAMA_MODEL.split(":")[0]
-            _ollama_available = any(base in m for m in models)
-            if _ollama_available:
-                log.info("✅ Ollama is up — using local model: %s", OLLAMA_MODEL)
-            else:
-                log.warning("⚠️  Ollama running but model '%s' not found. Run: ollama pull %s", OLLAMA_MODEL, OLLAMA_MODEL)
+        r = ollama_client().get("/api/tags", timeout=2)
+        r.raise_for_status()
+        models = [m["name"] for m in r.json().get("models", [])]
+        # Accept partial match (e.g. "llama3.2:3b" matches "llama3.2:3b-instruct-q4_K_M")
+        base = OLLAMA_MODEL.split(":")[0]
+        _ollama_available = any(base in m for m in models)
+        if _ollama_available:
+            log.info("✅ Ollama is up — using local model: %s", OLLAMA_MODEL)
+        else:
+            log.warning("⚠️  Ollama running but model '%s' not found. Run: ollama pull %s", OLLAMA_MODEL, OLLAMA_MODEL)
     except Exception:
         _ollama_available = False
         log.info("ℹ️  Ollama not running — will use Groq fallback")
@@ -113,22 +231,17 @@ def is_ollama_up() -> bool:
 
 def ollama_call(messages: list, max_tokens: int = 60) -> Optional[str]:
     """Call local Ollama with OpenAI-compatible /api/chat endpoint."""
-    payload = json.dumps({
+    payload = {
         "model": OLLAMA_MODEL,
         "messages": messages,
         "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
         "options": {"temperature": 0.0, "num_predict": max_tokens},
-    }).encode()
+    }
     try:
-        req = urllib.request.Request(
-            f"{OLLAMA_URL}/api/chat",
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=30) as r:
-            data = json.loads(r.read())
-            return data["message"]["content"].strip().strip('"').strip("'")
+        r = ollama_client().post("/api/chat", json=payload)
+        r.raise_for_status()
+        return r.json()["message"]["content"].strip().strip('"').strip("'")
     except Exception as exc:
         log.warning("Ollama call failed: %s", exc)
         return None
@@ -189,12 +302,15 @@ def llm_call(messages: list, max_tokens: int = 60) -> Optional[str]:
 # ─── PDF hashing ──────────────────────────────────────────────────────────────
 
 def file_hash(path: Path) -> str:
-    """SHA-256 of file content — used as cache key."""
-    h = hashlib.sha256()
+    """SHA-256 of file content — used as cache key.  Memoized per path + mtime + size."""
+    st = path.stat()
+    return _file_hash(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _file_hash(path: str, mtime_ns: int, size: int) -> str:
     with open(path, "rb") as f:
-        for block in iter(lambda: f.read(65536), b""):
-            h.update(block)
-    return h.hexdigest()[:16]
+        return hashlib.file_digest(f, "sha256").hexdigest()[:16]
 
 # ─── PDF Parsing ──────────────────────────────────────────────────────────────
 
@@ -232,26 +348,32 @@ _WORD_NUMS = {
     "eleven": "11", "twelve": "12",
 }
 
+# Heading patterns, tried in this order by detect_heading
+_SUB_RE      = re.compile(r'\b(\d+\.\d+(?:\.\d+)?)\s+([A-Z].+)')
+_SEC_RE      = re.compile(r'\b(Section\s+\d+\s*[:\-\u2013]?)\s+([A-Z].+)')
+_WORD_SEC_RE = re.compile(
+    r'\b(Section\s+(?:' + '|'.join(_WORD_NUMS) + r')\s*[:\-\u2013]?)\s+([A-Z].+)', re.IGNORECASE
+)
+_WORD_NUM_RES = [(re.compile(word, re.IGNORECASE), num) for word, num in _WORD_NUMS.items()]
+_CAPS_RE     = re.compile(r'(?:^|\s)([A-Z][A-Z\s]{8,50})(?:\s|$)')
+
 def detect_heading(text: str) -> Optional[str]:
     """Detect top-level section heading from flattened page text."""
     # Numbered subsection: 1.2 Title, 3.4.1 Title
-    sub = re.search(r'\b(\d+\.\d+(?:\.\d+)?)\s+([A-Z].+)', text)
+    sub = _SUB_RE.search(text)
     if sub: return extract_title(sub.group(1), sub.group(2))
     # "Section 5:" or "Section Five:"
-    sec = re.search(r'\b(Section\s+\d+\s*[:\-\u2013]?)\s+([A-Z].+)', text)
+    sec = _SEC_RE.search(text)
     if sec: return extract_title(sec.group(1), sec.group(2))
     # Word-based: "Section Two", "SECTION FIVE: Opening"
-    word_sec = re.search(
-        r'\b(Section\s+(?:' + '|'.join(_WORD_NUMS.keys()) + r')\s*[:\-\u2013]?)\s+([A-Z].+)',
-        text, re.IGNORECASE
-    )
+    word_sec = _WORD_SEC_RE.search(text)
     if word_sec:
         prefix = word_sec.group(1)
-        for word, num in _WORD_NUMS.items():
-            prefix = re.sub(word, num, prefix, flags=re.IGNORECASE)
+        for word_re, num in _WORD_NUM_RES:
+            prefix = word_re.sub(num, prefix)
         return extract_title(prefix, word_sec.group(2))
     # ALL-CAPS heading: "OPENING THE VOTING LOCATION", "ELECTION DAY PROCEDURES"
-    caps = re.search(r'(?:^|\s)([A-Z][A-Z\s]{8,50})(?:\s|$)', text)
+    caps = _CAPS_RE.search(text)
     if caps:
         heading = caps.group(1).strip()
         # Only accept if it looks like a real heading (not just uppercase body text)
@@ -274,6 +396,14 @@ _BOILERPLATE_LABELS = {
 _TITLE_SMALL_WORDS = {"the", "and", "or", "for", "of", "a", "an", "in", "to",
                       "on", "at", "by", "with", "is", "are", "as", "but", "not"}
 
+_TOC_PAGE_RE      = re.compile(r'\.\s*\d+$')
+_SECTION_LABEL_RE = re.compile(r'^Section\s+(?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+)$', re.IGNORECASE)
+# Sentence fragments that mark a line as body text rather than a heading
+_BODY_PHRASE_RE   = re.compile('|'.join(map(re.escape, [
+    "you will", "you can", "they will", "this is", "if the",
+    "do not", "must be", "please", "may not", "should be",
+])))
+
 
 def detect_subheading(line: str) -> Optional[str]:
     """
@@ -306,11 +436,11 @@ def detect_subheading(line: str) -> Optional[str]:
         return None
 
     # Skip table-of-contents lines (contain dotted leaders or page references)
-    if '..........' in stripped or re.search(r'\.\s*\d+$', stripped):
+    if '..........' in stripped or _TOC_PAGE_RE.search(stripped):
         return None
 
     # Skip standalone "Section N" labels (already captured by detect_heading)
-    if re.match(r'^Section\s+(?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|\d+)$', stripped, re.IGNORECASE):
+    if _SECTION_LABEL_RE.match(stripped):
         return None
 
     # Skip "continued" labels that just say "X, continued" — keep them as subheadings
@@ -344,8 +474,7 @@ def detect_subheading(line: str) -> Optional[str]:
 
     # Skip if it looks like body text (contains common sentence patterns)
     lower = stripped.lower()
-    if any(p in lower for p in ["you will", "you can", "they will", "this is", "if the",
-                                 "do not", "must be", "please", "may not", "should be"]):
+    if _BODY_PHRASE_RE.search(lower):
         return None
 
     # Skip lines that look like bullet points or list items
@@ -356,7 +485,21 @@ def detect_subheading(line: str) -> Optional[str]:
     return stripped + suffix
 
 
-_PAGE_NUM_LINE = re.compile(r'^\s*\d+\s*$', re.MULTILINE)
+# Running/label boilerplate, stripped in one pass.  Each alternative leaves the
+# newline that ends its line in place (lookahead), so back-to-back boilerplate
+# lines — header, then a label line — are all removed in the same scan
+_BOILERPLATE_RE = re.compile(
+    # Running header: year + manual name + spaces + section name, then page number on next line
+    r'\d{4}\s+\w+\s+Jurisdictional Manual[ \t]+[^\n]{0,100}\n\s*\d+\s*(?=\n)'
+    # Standalone page number lines
+    r'|^\s*\d+\s*$'
+    # Short label-only lines that repeat the section name (e.g. "Poll Worker Info", "General Info"),
+    # and "Section Two\n Poll Worker Information\n" type duplicate headings
+    r'|(?<=\n)[ \t]*(?:Poll Worker Info|General Info|Set Up Location|Open Location|'
+    r'Election Night|Nightly Closing|Provisional Voting|Equipment Info|'
+    r'Section (?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten))\s*(?=\n)',
+    re.MULTILINE,
+)
 
 def strip_page_boilerplate(text: str) -> str:
     """
@@ -364,22 +507,7 @@ def strip_page_boilerplate(text: str) -> str:
     Handles patterns like:
       '2026 March Jurisdictional Manual         Section Two: Poll Worker Information\n11\nPoll Worker Info\n'
     """
-    # Running header: year + manual name + spaces + section name, then page number on next line
-    text = re.sub(
-        r'\d{4}\s+\w+\s+Jurisdictional Manual[ \t]+[^\n]{0,100}\n\s*\d+\s*\n',
-        '', text
-    )
-    # Standalone page number lines
-    text = _PAGE_NUM_LINE.sub('', text)
-    # Short label-only lines that repeat the section name (e.g. "Poll Worker Info\n", "General Info\n")
-    text = re.sub(
-        r'\n[ \t]*(?:Poll Worker Info|General Info|Set Up Location|Open Location|'
-        r'Election Night|Nightly Closing|Provisional Voting|Equipment Info)\s*\n',
-        '\n', text
-    )
-    # "Section Two\n Poll Worker Information\n" type duplicate headings
-    text = re.sub(r'\n[ \t]*Section (?:One|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten)\s*\n', '\n', text)
-    return text
+    return _BOILERPLATE_RE.sub('', text)
 
 
 def parse_pdf(pdf_path: Path) -> List[dict]:
@@ -391,8 +519,10 @@ def parse_pdf(pdf_path: Path) -> List[dict]:
     last_section = "Introduction"
     last_subsection = ""
 
-    for pg in range(pymupdf_doc.page_count):
-        raw_text = pymupdf_doc[pg].get_text("text")
+    for page in pymupdf_doc:
+        # Text blocks in reading order; joined they are exactly get_text("text")
+        blocks = [b[4] for b in page.get_text("blocks") if b[6] == 0]
+        raw_text = "".join(blocks)
 
         # 1. Detect top-level section from flattened text
         full_text_flat = " ".join(raw_text.split())
@@ -402,9 +532,10 @@ def parse_pdf(pdf_path: Path) -> List[dict]:
             last_subsection = ""  # reset subsection when section changes
 
         # 2. Detect subsection from raw line-by-line text
-        raw_lines = [l.strip() for l in raw_text.split("\n") if l.strip()]
-        # Scan the first ~8 lines for subheadings (they appear near top of page)
-        for line in raw_lines[:8]:
+        # Scan the first ~8 lines for subheadings (they appear near top of page),
+        # reading only as many leading blocks as that takes
+        raw_lines = (l.strip() for b in blocks for l in b.split("\n"))
+        for line in islice(filter(None, raw_lines), 8):
             sub = detect_subheading(line)
             if sub:
                 last_subsection = sub
@@ -421,7 +552,7 @@ def parse_pdf(pdf_path: Path) -> List[dict]:
             continue
 
         pages.append({
-            "page_num":  pg + 1,
+            "page_num":  page.number + 1,
             "text":      text,
             "title":     title,
             "doc_id":    doc_id,
@@ -459,82 +590,228 @@ def generate_chunk_context(chunk_text: str, section_title: str, doc_name: str) -
 
 # ─── Disk Cache ───────────────────────────────────────────────────────────────
 
-CACHE_VERSION = "pplx-v1-280w-ctx2"  # bumped: added transport box fact extraction to contextual content
+def cache_fingerprint() -> str:
+    """
+    Hash of everything that shapes cached pages, chunks and vectors: the embedding
+    model, chunking params, and the source + patterns + word lists of the PDF
+    parser, heading detectors, chunker and boilerplate/context builders.  Any
+    change yields a new cache namespace, so there is no version string to bump.
+    """
+    spec = {
+        "model":           EMBED_MODEL,
+        "chunk":           CHUNK_SIZE,
+        "overlap":         OVERLAP,
+        "min":             MIN_CHUNK_WORDS,
+        "parse_src":       [inspect.getsource(f) for f in (parse_pdf, detect_heading, detect_subheading,
+                                                           extract_title, _stem)],
+        "parse_re":        [r.pattern for r in (_SUB_RE, _SEC_RE, _WORD_SEC_RE, _CAPS_RE,
+                                                _TOC_PAGE_RE, _SECTION_LABEL_RE, _BODY_PHRASE_RE)],
+        "parse_words":     [sorted(TABLE_MARKERS), _WORD_NUMS, sorted(_BOILERPLATE_LABELS),
+                            sorted(_TITLE_SMALL_WORDS)],
+        "chunk_src":       [inspect.getsource(f) for f in (chunk_pages, word_spans, enrich_with_context)],
+        "boilerplate_src": inspect.getsource(strip_page_boilerplate),
+        "boilerplate_re":  _BOILERPLATE_RE.pattern,
+        "gen_ctx_src":     inspect.getsource(generate_chunk_context),
+        "gen_ctx_re":      [r.pattern for r in (_TIME_RE, _DATE_RE, _BOX_RE)],
+    }
+    return hashlib.sha256(orjson.dumps(spec, option=orjson.OPT_SORT_KEYS)).hexdigest()[:12]
 
 def cache_path(doc_hash: str) -> Path:
     return CACHE_DIR / f"{doc_hash}_{CACHE_VERSION}.json"
 
+def _emb_tag() -> str:
+    # Embeddings differ per backend; the PyTorch ones keep the original name
+    return "" if embed_backend == "torch" else f"_{embed_backend}"
+
 def emb_cache_path(doc_hash: str) -> Path:
-    return CACHE_DIR / f"{doc_hash}_{CACHE_VERSION}.npy"
+    return CACHE_DIR / f"{doc_hash}_{CACHE_VERSION}{_emb_tag()}.npy"
+
+def pages_cache_path(doc_hash: str) -> Path:
+    return CACHE_DIR / f"{doc_hash}_{CACHE_VERSION}_pages.json"
+
+def pages_emb_cache_path(doc_hash: str) -> Path:
+    return CACHE_DIR / f"{doc_hash}_{CACHE_VERSION}_pages{_emb_tag()}.npy"
+
+
+def save_npy_atomic(path: Path, arr: np.ndarray) -> None:
+    """np.save via a temp file + rename, so other processes never read a partial file."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, path)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """path.write_bytes via a temp file + rename (see save_npy_atomic)."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+CACHE_BUILD_LOCK_PATH = CACHE_DIR / "cache-build.lock"
+_cache_build_mutex = threading.Lock()    # stands in for the flock without fcntl
+_mapped_hold_fd: Optional[int] = None    # LOCK_SH on the dense matrix this worker serves
+
+
+@contextmanager
+def cache_build_lock():
+    """
+    Exclusive flock across uvicorn workers while the disk cache is loaded, built
+    or pruned.  Every worker ingests at startup; without it one worker's cleanup
+    or rebuild races another's load.  Later workers wait, then load from cache.
+    """
+    if fcntl is None:
+        with _cache_build_mutex:
+            yield
+        return
+    fd = os.open(CACHE_BUILD_LOCK_PATH, os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)   # also drops the lock
+
+
+def hold_mapped_file(path: Path) -> None:
+    """
+    Keep a shared flock on `path` while this worker serves a memory map of it
+    (replacing the previous hold), so unlink_unless_mapped in any worker skips it.
+    """
+    global _mapped_hold_fd
+    if fcntl is None:
+        return
+    fd = os.open(path, os.O_RDONLY)
+    fcntl.flock(fd, fcntl.LOCK_SH)
+    if _mapped_hold_fd is not None:
+        os.close(_mapped_hold_fd)
+    _mapped_hold_fd = fd
 
 
-def load_chunk_cache(doc_hash: str) -> Optional[List[dict]]:
-    """Load cached chunks (without embeddings) from disk."""
+def unlink_unless_mapped(path: Path) -> bool:
+    """Delete `path` unless a worker holds it (hold_mapped_file).  True once it is gone."""
+    fd = None
+    try:
+        if fcntl is not None:
+            fd = os.open(path, os.O_RDONLY)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return True
+    except OSError:   # held by a worker (BlockingIOError), or open elsewhere on Windows
+        return False
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
+def load_chunk_cache(doc_hash: str) -> Optional[Tuple[List[dict], np.ndarray]]:
+    """Load cached chunks and their embedding matrix (memory-mapped) from disk."""
     cp = cache_path(doc_hash)
     ep = emb_cache_path(doc_hash)
-    if not cp.exists() or not ep.exists():
+    if not cp.exists():
         return None
     try:
-        cached = json.loads(cp.read_text())
-        embeddings = np.load(str(ep))
+        cached = orjson.loads(cp.read_bytes())
+        if not ep.exists():
+            # Enriched chunks are cached but not for this embedding backend —
+            # re-embed them rather than re-running the whole ingestion
+            embeddings = embed_chunks(cached, embedder)
+            save_chunk_cache(doc_hash, cached, embeddings)
+            return cached, embeddings
+        embeddings = np.load(str(ep), mmap_mode="r")
         if len(cached) != len(embeddings):
             log.warning("Cache mismatch for %s — will re-ingest", doc_hash)
             return None
-        for c, emb in zip(cached, embeddings):
-            c["embedding"] = emb
         log.info("✅ Loaded %d chunks from cache (%s)", len(cached), doc_hash[:8])
-        return cached
+        return cached, embeddings
     except Exception as exc:
         log.warning("Cache load failed (%s): %s", doc_hash[:8], exc)
         return None
 
 
-def save_chunk_cache(doc_hash: str, chunk_list: List[dict]) -> None:
-    """Persist chunks + embeddings to disk."""
+def save_chunk_cache(doc_hash: str, chunk_list: List[dict], embeddings: np.ndarray) -> None:
+    """Persist chunks (JSON) + their embedding matrix (.npy, row i ↔ chunk i) to disk."""
     try:
-        # Save JSON (everything except numpy array)
-        serialisable = [{k: v for k, v in c.items() if k != "embedding"} for c in chunk_list]
-        cache_path(doc_hash).write_text(json.dumps(serialisable, ensure_ascii=False))
-        # Save embeddings as numpy array
-        embeddings = np.stack([c["embedding"] for c in chunk_list])
-        np.save(str(emb_cache_path(doc_hash)), embeddings)
+        write_bytes_atomic(cache_path(doc_hash), orjson.dumps(chunk_list))
+        save_npy_atomic(emb_cache_path(doc_hash), embeddings)
         log.info("💾 Cached %d chunks to disk (%s)", len(chunk_list), doc_hash[:8])
     except Exception as exc:
         log.warning("Cache save failed: %s", exc)
 
+def load_pages(pdf_path: Path) -> List[dict]:
+    """
+    Parsed pages of `pdf_path`, from the disk cache when present (parsed and
+    cached otherwise).  Cached page embeddings are attached as "embedding".
+    """
+    doc_hash = file_hash(pdf_path)
+    pp = pages_cache_path(doc_hash)
+    pages: Optional[List[dict]] = None
+    if pp.exists():
+        try:
+            pages = orjson.loads(pp.read_bytes())
+        except Exception as exc:
+            log.warning("Page cache load failed (%s): %s", doc_hash[:8], exc)
+    if pages is None:
+        pages = parse_pdf(pdf_path)
+        try:
+            write_bytes_atomic(pp, orjson.dumps(pages))
+        except Exception as exc:
+            log.warning("Page cache save failed: %s", exc)
+
+    ep = pages_emb_cache_path(doc_hash)
+    if ep.exists():
+        try:
+            embeddings = np.load(str(ep))
+            if len(embeddings) == len(pages):
+                for p, emb in zip(pages, embeddings):
+                    p["embedding"] = emb
+        except Exception as exc:
+            log.warning("Page embedding cache load failed (%s): %s", doc_hash[:8], exc)
+    return pages
+
 # ─── Chunking ─────────────────────────────────────────────────────────────────
 
+def word_spans(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (start, end) char offsets of each word in single-space-separated text, as
+    parse_pdf produces it — so text[start[i]:end[j]] == " ".join(words[i:j + 1]).
+    """
+    codes  = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    spaces = np.flatnonzero(codes == 32)
+    return np.r_[0, spaces + 1], np.r_[spaces, len(text)]
+
+
 def chunk_pages(pages: List[dict]) -> List[dict]:
     """
     Sliding-window chunks within each page (never crosses page boundaries).
     Uses Groq contextual generation if available (with disk cache for each doc).
+    Each window is one slice of the page text, located via word offsets.
     """
     all_chunks: List[dict] = []
     chunk_counter = 0
+    step = max(1, CHUNK_SIZE - OVERLAP)
 
     for p in pages:
-        words = p["text"].split()
-        if len(words) < MIN_CHUNK_WORDS:
+        text = p["text"]
+        starts, ends = word_spans(text)
+        n_words = len(starts)
+        if n_words < MIN_CHUNK_WORDS:
             continue
-        step  = max(1, CHUNK_SIZE - OVERLAP)
-        start = 0
-        while start < len(words):
-            slice_words = words[start: start + CHUNK_SIZE]
-            if len(slice_words) < 15:
+        for start in range(0, n_words, step):
+            end = min(start + CHUNK_SIZE, n_words)
+            if end - start < 15:
                 break
-            raw = " ".join(slice_words)
             all_chunks.append({
                 "id":                f"chunk-{chunk_counter}",
                 "page":              p["page_num"],
                 "section_title":     p["title"],
                 "doc_id":            p["doc_id"],
                 "doc_name":          p["doc_name"],
-                "raw_content":       raw,
+                "raw_content":       text[starts[start]:ends[end - 1]],
                 "contextual_content": None,   # filled next
-                "embedding":         None,    # filled later
             })
             chunk_counter += 1
-            start += step
 
     return all_chunks
 
@@ -553,33 +830,81 @@ def enrich_with_context(chunk_list: List[dict]) -> List[dict]:
     log.info("✅ Contextual content done for %d chunks", total)
     return chunk_list
 
+# Computed once the parser and chunker it fingerprints are defined; the cache
+# paths above only read it at call time
+CACHE_VERSION = cache_fingerprint()
+
 # ─── Embeddings ───────────────────────────────────────────────────────────────
 
-def embed_chunks(chunk_list: List[dict], model: SentenceTransformer) -> List[dict]:
+def embed_chunks(chunk_list: List[dict], model: SentenceTransformer) -> np.ndarray:
+    """(n_chunks, dim) float32 embedding matrix, row i ↔ chunk_list[i]."""
     texts   = [c["contextual_content"] for c in chunk_list]
     log.info("🔢 Embedding %d chunks with %s...", len(texts), EMBED_MODEL)
-    vectors = model.encode(texts, batch_size=16, show_progress_bar=True, normalize_embeddings=False)
-    for c, vec in zip(chunk_list, vectors):
-        c["embedding"] = vec
+    vectors = model.encode(texts, batch_size=EMBED_BATCH_SIZE, show_progress_bar=True,
+                           normalize_embeddings=False, convert_to_numpy=True)
     log.info("✅ Embeddings done")
-    return chunk_list
+    return vectors
 
 # ─── BM25 Index ───────────────────────────────────────────────────────────────
 
+# numba (optional) JIT-compiles bm25s scoring + top-k; plain NumPy otherwise
+BM25_BACKEND = "numba" if _NUMBA_AVAILABLE else "numpy"
+
+
+def new_bm25(corpus: List[str], name: str) -> bm25s.BM25:
+    """
+    Index `corpus` on the fastest available bm25s backend, JIT already warm.
+    The texts aren't kept: retrieve() returns row indices into `corpus`.
+    The index is saved as CACHE_DIR/bm25_<name>_<CACHE_VERSION> and reloaded
+    from there while the corpus is unchanged, skipping tokenization.
+    """
+    save_dir = CACHE_DIR / f"bm25_{name}_{CACHE_VERSION}"
+    digest   = hashlib.sha256("\0".join(corpus).encode()).hexdigest()
+    retriever = load_bm25(save_dir, digest)
+    if retriever is None:
+        retriever = bm25s.BM25(backend=BM25_BACKEND)
+        retriever.index(bm25s.tokenize(corpus, stopwords="en"))
+        try:
+            # Digest last (and dropped first), so an interrupted save never loads
+            (save_dir / "corpus.sha256").unlink(missing_ok=True)
+            retriever.save(str(save_dir))
+            (save_dir / "corpus.sha256").write_text(digest)
+        except Exception as exc:
+            log.warning("BM25 index save failed (%s): %s", name, exc)
+    if BM25_BACKEND == "numba":
+        retriever.activate_numba_scorer()
+        # Compile now so the first user query doesn't pay for it
+        retriever.retrieve(bm25s.tokenize(["warmup"], show_progress=False), k=1, show_progress=False)
+    return retriever
+
+
+def load_bm25(save_dir: Path, digest: str) -> Optional[bm25s.BM25]:
+    """Saved index from `save_dir` if it was built from the corpus with this digest."""
+    try:
+        if (save_dir / "corpus.sha256").read_text() != digest:
+            return None
+        retriever = bm25s.BM25.load(str(save_dir))
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        log.warning("BM25 index load failed (%s): %s", save_dir.name, exc)
+        return None
+    retriever.backend = BM25_BACKEND   # saved params pin the backend it was built on
+    return retriever
+
+
 def build_bm25(chunk_list: List[dict]) -> bm25s.BM25:
     corpus    = [c["contextual_content"] for c in chunk_list]
-    tokenized = bm25s.tokenize(corpus, stopwords="en")
-    retriever = bm25s.BM25(corpus=corpus)
-    retriever.index(tokenized)
-    log.info("📚 BM25 index built over %d chunks", len(corpus))
+    retriever = new_bm25(corpus, "chunks")
+    log.info("📚 BM25 index built over %d chunks (%s backend)", len(corpus), BM25_BACKEND)
     return retriever
 
 # ─── Full ingestion for one PDF ───────────────────────────────────────────────
 
-def ingest_pdf(pdf_path: Path) -> List[dict]:
+def ingest_pdf(pdf_path: Path) -> Tuple[List[dict], np.ndarray]:
     """
     Full ingestion pipeline for a single PDF.
-    Returns a list of fully enriched + embedded chunks.
+    Returns the enriched chunks and their embedding matrix (row i ↔ chunk i).
     Caches results to disk — subsequent restarts skip Groq calls and re-embedding.
     """
     doc_hash = file_hash(pdf_path)
@@ -592,7 +917,7 @@ def ingest_pdf(pdf_path: Path) -> List[dict]:
     log.info("🆕 Ingesting %s (hash %s)...", pdf_path.name, doc_hash[:8])
 
     # 1. Parse
-    pages = parse_pdf(pdf_path)
+    pages = load_pages(pdf_path)
 
     # 2. Chunk (without context yet)
     doc_chunks = chunk_pages(pages)
@@ -601,95 +926,353 @@ def ingest_pdf(pdf_path: Path) -> List[dict]:
     doc_chunks = enrich_with_context(doc_chunks)
 
     # 4. Embed
-    doc_chunks = embed_chunks(doc_chunks, embedder)
+    embeddings = embed_chunks(doc_chunks, embedder)
 
     # 5. Save to disk cache
-    save_chunk_cache(doc_hash, doc_chunks)
+    save_chunk_cache(doc_hash, doc_chunks, embeddings)
 
-    return doc_chunks
+    return doc_chunks, embeddings
 
 # ─── Scan docs/ folder and ingest everything ─────────────────────────────────
 
+def chunk_cache_ready(pdf_path: Path) -> bool:
+    doc_hash = file_hash(pdf_path)
+    return cache_path(doc_hash).exists() and emb_cache_path(doc_hash).exists()
+
+
+def _ingest_worker_init(threads: int) -> None:
+    """Pool initializer: one embedder per worker, sized to its share of the cores."""
+    global embedder
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    embedder = load_embedder()
+
+
+def ingest_pdf_worker(pdf_path: Path) -> int:
+    """Child-process entry point: ingest one PDF into the disk cache."""
+    doc_chunks, _ = ingest_pdf(pdf_path)
+    return len(doc_chunks)
+
+
+def ingest_in_processes(pdf_files: List[Path]) -> None:
+    """
+    Fill the chunk cache for `pdf_files` in parallel worker processes.  The
+    caller then loads every PDF from cache; one that failed here is simply
+    ingested in-process.
+    """
+    workers = min(INGEST_WORKERS, len(pdf_files))
+    log.info("⚙️  Ingesting %d uncached PDF(s) across %d processes", len(pdf_files), workers)
+    # spawn, not fork: the parent's torch / OpenMP thread pools aren't fork-safe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_ingest_worker_init,
+                             initargs=(max(1, (os.cpu_count() or 1) // workers),)) as pool:
+        futures = {pool.submit(ingest_pdf_worker, pdf): pdf for pdf in pdf_files}
+        for fut in as_completed(futures):
+            try:
+                log.info("  ✅ %s → %d chunks (worker)", futures[fut].name, fut.result())
+            except Exception as exc:
+                log.warning("Worker ingest of %s failed (%s) — retrying in-process", futures[fut].name, exc)
+
+
 def clean_stale_cache() -> None:
-    """Remove cache files from older model/config versions."""
+    """Remove cache files whose name doesn't carry the current cache fingerprint."""
     for f in CACHE_DIR.glob("*.json"):
         if CACHE_VERSION not in f.name:
             f.unlink()
             log.info("🗑️  Removed stale cache: %s", f.name)
     for f in CACHE_DIR.glob("*.npy"):
-        if CACHE_VERSION not in f.name:
+        if CACHE_VERSION not in f.name and not f.name.startswith("dense_chunks_"):
             f.unlink()
             log.info("🗑️  Removed stale cache: %s", f.name)
+    remove_dense_files(s for s in dense_stems() if CACHE_VERSION not in s)
+    for d in CACHE_DIR.glob("bm25_*"):
+        if CACHE_VERSION not in d.name:
+            shutil.rmtree(d, ignore_errors=True)
+            log.info("🗑️  Removed stale cache: %s", d.name)
 
 
-def build_page_index(all_pages: List[dict]) -> None:
-    """Build page-level BM25 + embedding index for fallback retrieval."""
-    global pages_store, pages_bm25
+def save_page_embeddings(all_pages: List[dict], doc_ids: set) -> None:
+    """Persist page embeddings for the given docs next to their page cache."""
+    for doc_id in doc_ids:
+        try:
+            embeddings = np.stack([p["embedding"] for p in all_pages if p["doc_id"] == doc_id])
+            save_npy_atomic(pages_emb_cache_path(doc_id), embeddings)
+        except Exception as exc:
+            log.warning("Page embedding cache save failed: %s", exc)
+
+
+def build_page_index(all_pages: List[dict]) -> Dict[str, Any]:
+    """Build page-level BM25 + embedding index for fallback retrieval (as _ChunkIndex fields)."""
     if not all_pages or embedder is None:
-        return
+        return {}
 
-    log.info("📄 Building page-level index for %d pages...", len(all_pages))
-    # Embed full page text (with section title prefix for context)
+    # Embed full page text (with section title prefix for context); pages
+    # restored from the disk cache arrive already embedded
     page_texts = [f"[{p['title']}] {p['text']}" for p in all_pages]
-    page_vectors = embedder.encode(page_texts, batch_size=8, show_progress_bar=True, normalize_embeddings=False)
-    for p, vec in zip(all_pages, page_vectors):
-        p["embedding"] = vec
+    missing = [i for i, p in enumerate(all_pages) if "embedding" not in p]
+    log.info("📄 Building page-level index for %d pages (%d to embed)...", len(all_pages), len(missing))
+    if missing:
+        vectors = embedder.encode([page_texts[i] for i in missing], batch_size=PAGE_EMBED_BATCH_SIZE,
+                                  show_progress_bar=True, normalize_embeddings=False)
+        for i, vec in zip(missing, vectors):
+            all_pages[i]["embedding"] = vec
+        save_page_embeddings(all_pages, {all_pages[i]["doc_id"] for i in missing})
 
-    pages_store = all_pages
+    pages_emb_matrix, pages_emb_scale = build_dense_index([p["embedding"] for p in all_pages])
 
     # BM25 over page text
-    tokenized = bm25s.tokenize(page_texts, stopwords="en")
-    pages_bm25 = bm25s.BM25(corpus=page_texts)
-    pages_bm25.index(tokenized)
-    log.info("✅ Page-level index built: %d pages", len(pages_store))
+    pages_bm25 = new_bm25(page_texts, "pages")
+    log.info("✅ Page-level index built: %d pages", len(all_pages))
+    return dict(pages_store=all_pages, pages_bm25=pages_bm25,
+                pages_emb_matrix=pages_emb_matrix, pages_emb_scale=pages_emb_scale)
+
+
+def term_postings(texts: List[str], pattern: re.Pattern) -> Dict[str, np.ndarray]:
+    """Every `pattern` match in `texts` → ascending rows of the texts containing it."""
+    rows: Dict[str, List[int]] = defaultdict(list)
+    for i, text in enumerate(texts):
+        for term in set(pattern.findall(text)):
+            rows[term].append(i)
+    return {term: np.array(r, dtype=np.intp) for term, r in rows.items()}
+
+
+def rows_containing(index: _ChunkIndex, word: str) -> np.ndarray:
+    """
+    Ascending rows whose combined_lower contains `word` as a substring.  A
+    _QUERY_WORD_RE word can only occur inside a single vocabulary token (it
+    starts and ends alphanumeric and has no run of separators), so searching
+    the vocabulary and unioning postings equals scanning every chunk.
+    """
+    hits = [m.start() for m in re.finditer(re.escape(word), index.rescue_vocab)]
+    if not hits:
+        return np.empty(0, dtype=np.intp)
+    tokens = np.unique(np.searchsorted(index.rescue_vocab_starts, hits, side="right") - 1)
+    return np.unique(np.concatenate([index.rescue_postings[t] for t in tokens.tolist()]))
+
+
+def pattern_hits(texts: List[str], pattern: re.Pattern) -> np.ndarray:
+    """Boolean mask: does `pattern` occur in each of `texts`."""
+    search = pattern.search
+    return np.fromiter((search(t) is not None for t in texts), dtype=bool, count=len(texts))
 
 
 def ingest_all_docs() -> None:
-    """Scan docs/ for PDFs, ingest each, merge into global index."""
-    global chunks, bm25_index
+    """
+    Scan docs/ for PDFs, ingest each, and publish the merged corpus as a new
+    _ChunkIndex.  Everything is built into locals first; searches keep using
+    the previous `_index` until the single assignment at the end.
+    """
+    global _index
+    with cache_build_lock():
+        index = build_chunk_index()
+    if index is None:
+        return
+    _index = index
+    _retrieve_cache.clear()   # results from the previous corpus are stale
+    log.info("🧠 RAG sidecar ready — %d chunks + %d pages across %d doc(s)",
+             len(index.chunks), len(index.pages_store), len({c["doc_id"] for c in index.chunks}))
+
+
+def build_chunk_index() -> Optional[_ChunkIndex]:
+    """Load (or build) every PDF's cached chunks and assemble the next _ChunkIndex; None without PDFs."""
     clean_stale_cache()
 
     pdf_files = sorted(DOCS_DIR.glob("**/*.pdf"))
     if not pdf_files:
         log.warning("⚠️  No PDFs found in %s", DOCS_DIR)
-        return
+        return None
 
     log.info("📂 Found %d PDF(s) in docs/", len(pdf_files))
+    cold = [pdf for pdf in pdf_files if not chunk_cache_ready(pdf)]
+    if len(cold) > 1 and INGEST_WORKERS > 1:
+        ingest_in_processes(cold)
+
     all_chunks: List[dict] = []
     all_pages: List[dict] = []
+    all_embeddings: List[np.ndarray] = []
     for pdf in pdf_files:
-        doc_chunks = ingest_pdf(pdf)
+        doc_chunks, doc_embeddings = ingest_pdf(pdf)
         all_chunks.extend(doc_chunks)
+        all_embeddings.append(doc_embeddings)
         # Also collect parsed pages for page-level index
-        pages = parse_pdf(pdf)
+        pages = load_pages(pdf)
         all_pages.extend(pages)
         log.info("  ✅ %s → %d chunks, %d pages", pdf.name, len(doc_chunks), len(pages))
 
     chunks     = all_chunks
     bm25_index = build_bm25(chunks)
+    by_id: Dict[str, List[dict]] = defaultdict(list)
+    by_page: Dict[tuple, List[dict]] = defaultdict(list)
+    for c in chunks:
+        # Lowercased once here; keyword rescue matches against these every query
+        c["raw_lower"]      = c["raw_content"].lower()
+        c["combined_lower"] = c["raw_lower"] + " " + c.get("contextual_content", "").lower()
+        by_id[c["id"]].append(c)
+        by_page[(c["doc_id"], c["page"])].append(c)
+    chunk_ids = np.array([c["id"] for c in chunks], dtype=object)
+    key_ids, chunk_key = np.unique(chunk_ids, return_inverse=True)
+    chunk_key_count = np.bincount(chunk_key)
+    chunk_key_row = np.zeros(len(chunk_key_count), dtype=np.intp)
+    np.maximum.at(chunk_key_row, chunk_key, np.arange(len(chunks)))
+    vocab = term_postings([c["combined_lower"] for c in chunks], _QUERY_WORD_RE)
+    chunk_emb_matrix, chunk_emb_scale = cached_dense_index(all_embeddings, [c["contextual_content"] for c in chunks])
+
+    return _ChunkIndex(
+        version             = _index.version + 1,
+        chunks              = chunks,
+        bm25_index          = bm25_index,
+        chunks_by_id        = dict(by_id),
+        chunks_by_page      = dict(by_page),
+        chunk_ids           = chunk_ids,
+        chunk_key           = chunk_key,
+        chunk_key_row       = chunk_key_row,
+        chunk_key_count     = chunk_key_count,
+        chunk_key_by_id     = {cid: k for k, cid in enumerate(key_ids.tolist())},
+        chunk_time_rows     = term_postings([c["raw_lower"] for c in chunks], _TIME_Q_RE),
+        chunk_num_rows      = term_postings([c["raw_content"] for c in chunks], _NUM_Q_RE),
+        rescue_vocab        = "\n".join(vocab),
+        rescue_vocab_starts = np.cumsum([0] + [len(t) + 1 for t in vocab])[:-1],
+        rescue_postings     = list(vocab.values()),
+        chunk_has_time      = pattern_hits([c["raw_content"] for c in chunks], _TIME_Q_RE),
+        chunk_has_phone     = pattern_hits([c["raw_content"] for c in chunks], _PHONE_PATTERN),
+        chunk_low_content   = pattern_hits([c["raw_content"] for c in chunks], _LOW_PRIORITY_CONTENT),
+        chunk_low_title     = pattern_hits([c["section_title"] for c in chunks], _LOW_PRIORITY_SECTIONS),
+        chunk_closing_title = pattern_hits([c["section_title"] for c in chunks], _CLOSING_SECTIONS),
+        chunk_emb_matrix    = chunk_emb_matrix,
+        chunk_emb_scale     = chunk_emb_scale,
+        # Only the Hamming prefilter reads these, and only on large corpora
+        chunk_emb_bits      = (np.packbits(chunk_emb_matrix > 0, axis=1)
+                               if len(chunks) > DENSE_PREFILTER_MIN else None),
+        # Page-level fallback index
+        **build_page_index(all_pages),
+    )
 
-    # Build page-level fallback index
-    build_page_index(all_pages)
+# ─── Retrieval ────────────────────────────────────────────────────────────────
 
-    log.info("🧠 RAG sidecar ready — %d chunks + %d pages across %d doc(s)",
-             len(chunks), len(pages_store), len(pdf_files))
+def normalized_matrix(vectors) -> np.ndarray:
+    """
+    Stack embeddings — 1-D vectors or 2-D per-document blocks (possibly
+    read-only memmaps) — into a new contiguous float32 matrix with unit rows.
+    """
+    m = np.vstack(vectors).astype(np.float32, copy=False)
+    m /= np.linalg.norm(m, axis=1, keepdims=True) + 1e-8
+    return m
 
-# ─── Retrieval ────────────────────────────────────────────────────────────────
 
-def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-    a = a.astype(np.float32)
-    b = b.astype(np.float32)
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-8))
+def quantize_int8(m: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8: m[i] ≈ q[i] * scale[i].  Keeps dot products rank-preserving."""
+    scale = (np.abs(m).max(axis=1) / 127.0 + 1e-12).astype(np.float32)
+    return np.round(m / scale[:, None]).astype(np.int8), scale
 
 
-def normalize_scores(scored: List[tuple]) -> Dict[str, float]:
-    if not scored:
-        return {}
-    scores = [s for _, s in scored]
-    mn, mx = min(scores), max(scores)
-    if mx == mn:
-        return {cid: 1.0 for cid, _ in scored}
-    return {cid: (s - mn) / (mx - mn) for cid, s in scored}
+def build_dense_index(vectors) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """(matrix, per-row scale or None) in the configured EMBED_QUANTIZATION."""
+    m = normalized_matrix(vectors)
+    if EMBED_QUANTIZATION == "int8":
+        return quantize_int8(m)
+    return m, None
+
+
+def cached_dense_index(blocks: List[np.ndarray], texts: List[str]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    build_dense_index(blocks) for the chunk corpus, saved under CACHE_DIR and
+    memory-mapped from there — reused across restarts while the chunk texts are
+    unchanged, so the serving matrix lives in the OS page cache, not the heap.
+    Runs under cache_build_lock.  The mapped file is held (hold_mapped_file), and
+    superseded matrices are removed only once no worker still serves them.
+    """
+    digest = hashlib.sha256("\0".join(texts).encode()).hexdigest()[:16]
+    stem   = f"dense_chunks_{CACHE_VERSION}{_emb_tag()}_{EMBED_QUANTIZATION}_{digest}"
+    mp, sp = CACHE_DIR / f"{stem}.npy", CACHE_DIR / f"{stem}.scale.npy"
+    want_scale = EMBED_QUANTIZATION == "int8"
+    if mp.exists() and sp.exists() == want_scale:
+        try:
+            matrix = np.load(str(mp), mmap_mode="r")
+            if len(matrix) == len(texts):
+                hold_mapped_file(mp)
+                remove_dense_files(dense_stems() - {stem})
+                return matrix, (np.load(str(sp), mmap_mode="r") if want_scale else None)
+        except Exception as exc:
+            log.warning("Dense index load failed (%s): %s", stem, exc)
+
+    matrix, scale = build_dense_index(blocks)
+    try:
+        save_npy_atomic(mp, matrix)
+        if scale is not None:
+            save_npy_atomic(sp, scale)
+        mapped = np.load(str(mp), mmap_mode="r"), (np.load(str(sp), mmap_mode="r") if want_scale else None)
+        hold_mapped_file(mp)
+        remove_dense_files(dense_stems() - {stem})
+        return mapped
+    except Exception as exc:
+        log.warning("Dense index save failed: %s", exc)
+        return matrix, scale
+
+
+def dense_stems() -> set:
+    """Stems of the dense matrices saved in CACHE_DIR (each has a .npy, maybe a .scale.npy)."""
+    return {f.name.removesuffix(".npy").removesuffix(".scale") for f in CACHE_DIR.glob("dense_chunks_*.npy")}
+
+
+def remove_dense_files(stems) -> None:
+    """Delete each dense matrix (and its scales) that no worker is serving."""
+    for stem in stems:
+        if unlink_unless_mapped(CACHE_DIR / f"{stem}.npy"):
+            (CACHE_DIR / f"{stem}.scale.npy").unlink(missing_ok=True)
+            log.info("🗑️  Removed stale cache: %s", stem)
+
+
+def dense_scores(matrix: np.ndarray, scale: Optional[np.ndarray], q: np.ndarray) -> np.ndarray:
+    """Cosine of the unit query against every row of a build_dense_index matrix."""
+    if scale is None:
+        return matrix @ q
+    q8, q_scale = quantize_int8(q[None, :])
+    dots = np.einsum("ij,j->i", matrix, q8[0], dtype=np.int32)   # int32 accumulate, no overflow
+    return dots * (scale * q_scale[0])
+
+
+# Set-bit count of every byte value (NumPy 1.x has no bitwise_count)
+_POPCOUNT8 = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+def hamming_shortlist(bits: np.ndarray, q: np.ndarray, k: int) -> np.ndarray:
+    """Ascending row ids of the k rows whose sign codes are nearest the query's."""
+    dist = _POPCOUNT8[np.bitwise_xor(bits, np.packbits(q > 0))].sum(axis=1, dtype=np.int32)
+    if k >= len(dist):
+        return np.arange(len(dist))
+    return np.sort(np.argpartition(dist, k)[:k])
+
+
+def query_vector(query: str) -> np.ndarray:
+    """Embed a query as a unit-length float32 vector (matches normalized_matrix rows)."""
+    q = embedder.encode([query], normalize_embeddings=False)[0].astype(np.float32)
+    return q / (np.linalg.norm(q) + 1e-8)
+
+
+def minmax(x: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Min-max normalize against (lo, hi) — the full population's bounds when
+    `x` is only a top-k slice, so scores stay comparable.  All 1.0 if lo == hi."""
+    if hi == lo:
+        return np.ones_like(x)
+    return (x - lo) / (hi - lo)
+
+
+def fuse_scores(n: int, bm25: tuple, cosine: tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    50/50 fusion of min-max normalized BM25 and cosine scores over `n` slots.
+    Each side is (unique slot indices, float64 scores, (lo, hi) bounds); a slot
+    missing from one side scores 0 there.  Returns (slots present, fused).
+    """
+    fused   = np.zeros(n)
+    present = np.zeros(n, dtype=bool)
+    for idx, vals, (lo, hi) in (bm25, cosine):
+        fused[idx] += 0.5 * minmax(vals, lo, hi)
+        present[idx] = True
+    slots = np.flatnonzero(present)
+    return slots, fused[slots]
 
 
 # Sections/content patterns that are reference/appendix material — penalise in ranking
@@ -712,6 +1295,30 @@ _CLOSING_SECTIONS = re.compile(
     r'packing\s+checklist|election\s+night\s+only|nightly\s+closing|sealing\s+election|closing\s+check',
     re.IGNORECASE
 )
+# Phone numbers like "(602) 506-1511" — shared by the score boost and keyword rescue
+_PHONE_PATTERN = re.compile(r'\(\d{3}\)\s*\d{3}[-\s]?\d{4}')
+# Query-time keyword boosts
+_TIME_Q_RE  = re.compile(r'\b\d{1,2}:\d{2}\s*(?:a\.m\.|p\.m\.|am|pm)\b', re.IGNORECASE)
+_NUM_Q_RE   = re.compile(r'\b\d+\b')
+_PHONE_Q_RE = re.compile(r'\bphone\b|\bhotline\b|\bnumber\b|\bcontact\b', re.IGNORECASE)
+# Keyword rescue: lowercase query words, and ALL-CAPS terms like BLUE or FORMER
+_QUERY_WORD_RE = re.compile(r'[a-z0-9]+(?:[.\'-][a-z0-9]+)*')
+_ACRONYM_RE    = re.compile(r'\b[A-Z]{2,}(?:\s+[A-Z][a-z]+)*\b')
+_STOPWORDS = frozenset({
+    "the","and","for","are","was","how","what","when","where","who",
+    "does","can","they","their","this","that","with","from","have",
+    "been","will","would","should","could","about","into","than",
+    "also","just","very","much","some","any","all","each",
+    "which","there","these","those","other","your","after","before",
+    "between","during","through","above","below","out","off","over",
+    "under","again","further","then","once","here","why","both","few",
+    "more","most","such","only","same","too","but","not","own","its",
+    "our","you","has","had","did","get","got","let","may","use","way",
+    "try","ask","put","say","take","come","make","like","know","see",
+    "think","want","give","tell","call","keep","show","turn","move",
+    "need","still","might","must","shall","upon","onto","within","without",
+    "along","since","until","while","whom","whose",
+})
 
 def expand_query(query: str) -> str:
     """
@@ -723,199 +1330,250 @@ def expand_query(query: str) -> str:
     return query
 
 
-def page_level_search(query: str, top_k: int = 3) -> List[dict]:
+def page_level_search(query: str, top_k: int = 3, q_vec: Optional[np.ndarray] = None,
+                      index: Optional[_ChunkIndex] = None) -> List[dict]:
     """
     Search at the page level — rescues answers that chunk-level search misses.
-    Returns pages with their scores.
+    Returns pages with their scores.  `q_vec`: the query's query_vector, if the
+    caller already has it; `index`: the snapshot to search (default: `_index`).
     """
+    if index is None:
+        index = _index
+    pages_store, pages_bm25 = index.pages_store, index.pages_bm25
     if not pages_store or pages_bm25 is None or embedder is None:
         return []
 
     # BM25
     q_tokens = bm25s.tokenize([query], stopwords="en")
     bm25_res, bm25_scores = pages_bm25.retrieve(q_tokens, k=min(len(pages_store), 20))
-    page_text_to_idx = {f"[{p['title']}] {p['text']}": i for i, p in enumerate(pages_store)}
-    bm25_scored = []
-    for doc_text, score in zip(bm25_res[0], bm25_scores[0]):
-        idx = page_text_to_idx.get(str(doc_text))
-        if idx is not None:
-            bm25_scored.append((idx, float(score)))
-
-    # Cosine
-    q_vec = embedder.encode([query], normalize_embeddings=False)[0]
-    cosine_scored = [(i, cosine_similarity(q_vec, p["embedding"]))
-                     for i, p in enumerate(pages_store)]
+    bm25_rows, bm25_vals = bm25_res[0], bm25_scores[0].astype(np.float64)
+
+    # Cosine — only the best pages plus the BM25 hits take part in fusion,
+    # normalized over all pages
+    if q_vec is None:
+        q_vec = query_vector(query)
+    dense = dense_scores(index.pages_emb_matrix, index.pages_emb_scale, q_vec)
+    cos_rows = np.union1d(top_rows(dense, max(top_k * 6, 100)), bm25_rows)
 
     # Fuse
-    bm25_norm = normalize_scores([(str(i), s) for i, s in bm25_scored])
-    cosine_norm = normalize_scores([(str(i), s) for i, s in cosine_scored])
-    all_ids = set(bm25_norm) | set(cosine_norm)
-    fused = {
-        idx: 0.5 * bm25_norm.get(idx, 0.0) + 0.5 * cosine_norm.get(idx, 0.0)
-        for idx in all_ids
-    }
-    sorted_ids = sorted(fused, key=lambda x: -fused[x])[:top_k]
+    rows, fused = fuse_scores(
+        len(pages_store),
+        (bm25_rows, bm25_vals, (float(bm25_vals.min()), float(bm25_vals.max()))),
+        (cos_rows, dense[cos_rows].astype(np.float64), (float(dense.min()), float(dense.max()))),
+    )
+    top = np.argsort(-fused, kind="stable")[:top_k]
 
     results = []
-    for idx_str in sorted_ids:
-        idx = int(idx_str)
+    for idx, score in zip(rows[top].tolist(), fused[top].tolist()):
         p = pages_store[idx]
         results.append({
             "page_num": p["page_num"],
             "doc_id": p["doc_id"],
             "title": p["title"],
-            "score": fused[idx_str],
+            "score": score,
         })
     return results
 
 
-def hybrid_search(query: str, top_k: int = FINAL_TOP_K) -> List[dict]:
+def top_rows(scores: np.ndarray, k: int) -> List[int]:
+    """Row indices of the k highest scores (unordered)."""
+    if k >= len(scores):
+        return list(range(len(scores)))
+    return np.argpartition(scores, -k)[-k:].tolist()
+
+
+def top_order(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first, ties by position — the
+    first k of np.argsort(-scores, kind="stable") without sorting the rest.
+    """
+    neg = -scores
+    if k >= len(neg):
+        return np.argsort(neg, kind="stable")
+    kth  = np.partition(neg, k - 1)[k - 1]
+    head = np.flatnonzero(neg < kth)
+    ties = np.flatnonzero(neg == kth)[:k - len(head)]
+    sel  = np.sort(np.concatenate((head, ties)))
+    return sel[np.argsort(neg[sel], kind="stable")]
+
+
+def iter_ranked(scores: np.ndarray, first: int):
+    """Yield positions in top_order, selecting `first` up front, then doubling blocks."""
+    remaining = np.arange(len(scores))
+    k = max(1, first)
+    while len(remaining):
+        top = top_order(scores[remaining], k)
+        yield from remaining[top].tolist()
+        remaining = np.delete(remaining, top)
+        k *= 2
+
+
+def hybrid_search(query: str, top_k: int = FINAL_TOP_K, index: Optional[_ChunkIndex] = None) -> List[dict]:
     """
     BM25 (expanded query) + cosine (original query) → normalized 50/50 fusion.
     Page-level rescue: if top chunk score is low, add chunks from best-matching pages.
+    `index`: the snapshot to search (default: `_index`, bound once for the call).
     """
-    if not chunks or bm25_index is None:
+    if index is None:
+        index = _index
+    chunks, chunk_key, chunk_key_row = index.chunks, index.chunk_key, index.chunk_key_row
+    if not chunks or index.bm25_index is None:
         return []
 
     search_query = expand_query(query)
 
     # ── BM25 ──────────────────────────────────────────────────────────────────
+    # Only a shortlist takes part in fusion; chunks BM25 doesn't return count as 0
+    k_shortlist = min(len(chunks), max(top_k * 6, 100))
     q_tokens   = bm25s.tokenize([search_query], stopwords="en")
-    bm25_res, bm25_scores = bm25_index.retrieve(q_tokens, k=len(chunks))
-    text_to_id = {c["contextual_content"]: c["id"] for c in chunks}
-    bm25_scored = []
-    for doc_text, score in zip(bm25_res[0], bm25_scores[0]):
-        cid = text_to_id.get(str(doc_text))
-        if cid:
-            bm25_scored.append((cid, float(score)))
+    bm25_res, bm25_scores = index.bm25_index.retrieve(q_tokens, k=k_shortlist)
+    bm25_vals = bm25_scores[0].astype(np.float64)
+    bm25_lo   = float(bm25_vals.min()) if k_shortlist == len(chunks) else 0.0
+    # An id shared across documents fuses with its lowest-ranked chunk's score;
+    # if that chunk fell outside the shortlist the id counts as 0
+    n_keys    = len(chunk_key_row)
+    hit_keys  = chunk_key[bm25_res[0]]
+    key_min   = np.full(n_keys, np.inf)
+    np.minimum.at(key_min, hit_keys, bm25_vals)
+    bm25_keys = np.flatnonzero(np.bincount(hit_keys, minlength=n_keys) == index.chunk_key_count)
+    bm25_hi   = float(bm25_vals.max())
+    if bm25_hi == bm25_lo:
+        # Flat BM25 (e.g. no query term in the vocabulary): the shortlist is
+        # arbitrary, so every id gets the same BM25 share and cosine decides
+        bm25_keys = np.arange(n_keys)
+        key_min   = np.full(n_keys, bm25_lo)
+    bm25      = (bm25_keys, key_min[bm25_keys], (bm25_lo, bm25_hi))
 
     # ── Dense cosine ──────────────────────────────────────────────────────────
-    q_vec = embedder.encode([query], normalize_embeddings=False)[0]
-    cosine_scored = [(c["id"], cosine_similarity(q_vec, c["embedding"])) for c in chunks]
+    q_vec = query_vector(query)
+    if len(chunks) > DENSE_PREFILTER_MIN:
+        # Large corpus: Hamming shortlist, exact cosine only for the survivors
+        rows  = hamming_shortlist(index.chunk_emb_bits, q_vec, DENSE_SHORTLIST)
+        scale = None if index.chunk_emb_scale is None else index.chunk_emb_scale[rows]
+        dense = dense_scores(index.chunk_emb_matrix[rows], scale, q_vec)
+        # Rows ascend, so the last occurrence of a key is its last chunk
+        keys, first_rev = np.unique(chunk_key[rows][::-1], return_index=True)
+        cos_vals = dense[len(rows) - 1 - first_rev]
+    else:
+        # Shortlist plus the BM25 hits; an id shared across documents takes the
+        # score of its last chunk, as the id lookups below do
+        dense = dense_scores(index.chunk_emb_matrix, index.chunk_emb_scale, q_vec)
+        keys  = np.union1d(chunk_key[top_rows(dense, k_shortlist)], hit_keys)
+        cos_vals = dense[chunk_key_row[keys]]
+    cosine = (keys, cos_vals.astype(np.float64), (float(dense.min()), float(dense.max())))
 
     # ── Keyword boost: chunks with exact times/numbers rank higher ─────────────
-    TIME_PATTERN  = re.compile(r'\b\d{1,2}:\d{2}\s*(?:a\.m\.|p\.m\.|am|pm)\b', re.IGNORECASE)
-    PHONE_PATTERN = re.compile(r'\(\d{3}\)\s*\d{3}[-\s]\d{4}')
-    NUM_PATTERN   = re.compile(r'\b\d+\b')
-    query_times   = set(TIME_PATTERN.findall(query))
-    query_nums    = set(NUM_PATTERN.findall(query))
-    query_asks_phone = bool(re.search(r'\bphone\b|\bhotline\b|\bnumber\b|\bcontact\b', query, re.IGNORECASE))
-
-    def score_adjustment(c: dict) -> float:
-        raw = c.get("raw_content", "")
-        title = c.get("section_title", "")
-        adj = 0.0
-        # Boost for matching times in query
-        for t in query_times:
-            if t.lower() in raw.lower():
-                adj += 0.15
-        for n in query_nums:
-            if re.search(r'\b' + re.escape(n) + r'\b', raw):
-                adj += 0.05
-        # Boost any chunk with a time expression (for time-related queries)
-        if TIME_PATTERN.search(raw):
-            adj += 0.05
-        # Boost chunks with phone numbers when query asks for a phone/contact
-        if query_asks_phone and PHONE_PATTERN.search(raw):
-            adj += 0.3
-        # Penalise appendix / FAQ / reference sections
-        if _LOW_PRIORITY_SECTIONS.search(title):
-            adj -= 0.5
-        # Penalise by chunk content too (catches misclassified appendix pages)
-        if _LOW_PRIORITY_CONTENT.search(raw):
-            adj -= 0.4
-        # Boost closing/packing sections when query asks about transport boxes
-        if _PACKING_QUERY.search(query) and _CLOSING_SECTIONS.search(title):
-            adj += 0.4
-        return adj
+    query_times   = set(_TIME_Q_RE.findall(query))
+    query_nums    = set(_NUM_Q_RE.findall(query))
+    query_asks_phone = bool(_PHONE_Q_RE.search(query))
+
+    # Boost for times / numbers from the query, looked up in the ingest postings,
+    # plus the static per-chunk adjustments from the ingest pattern masks
+    adj = np.zeros(len(chunks))
+    for t in query_times:
+        adj[index.chunk_time_rows.get(t.lower(), [])] += 0.15
+    for n in query_nums:
+        adj[index.chunk_num_rows.get(n, [])] += 0.05
+    # Boost any chunk with a time expression (for time-related queries)
+    adj[index.chunk_has_time] += 0.05
+    # Boost chunks with phone numbers when query asks for a phone/contact
+    if query_asks_phone:
+        adj[index.chunk_has_phone] += 0.3
+    # Penalise appendix / FAQ / reference sections
+    adj[index.chunk_low_title] -= 0.5
+    # Penalise by chunk content too (catches misclassified appendix pages)
+    adj[index.chunk_low_content] -= 0.4
+    # Boost closing/packing sections when query asks about transport boxes
+    if _PACKING_QUERY.search(query):
+        adj[index.chunk_closing_title] += 0.4
 
     # ── Fuse ──────────────────────────────────────────────────────────────────
-    bm25_norm   = normalize_scores(bm25_scored)
-    cosine_norm = normalize_scores(cosine_scored)
-    all_ids     = set(bm25_norm) | set(cosine_norm)
-    id_to_chunk = {c["id"]: c for c in chunks}
-    fused       = {
-        cid: 0.5 * bm25_norm.get(cid, 0.0)
-             + 0.5 * cosine_norm.get(cid, 0.0)
-             + score_adjustment(id_to_chunk.get(cid, {}))
-        for cid in all_ids
-    }
-    sorted_ids = sorted(fused, key=lambda x: -fused[x])
+    keys, fused_vals = fuse_scores(n_keys, bm25, cosine)
+    rows = chunk_key_row[keys]
+    fused_vals += adj[rows]
+    # Ranking is produced lazily: only the head is partitioned out and sorted
+    # up front; further blocks are sorted only when more are pulled
+    ranked    = iter_ranked(fused_vals, top_k - 5)
+    key_score = np.zeros(n_keys)
+    key_score[keys] = fused_vals
+    is_candidate = np.zeros(n_keys, dtype=bool)
+    is_candidate[keys] = True
+
+    def fused(cid: str) -> float:
+        """Fused score of a chunk id (0.0 if it was neither a candidate nor rescued)."""
+        return float(key_score[index.chunk_key_by_id[cid]])
 
     # ── Direct keyword rescue: find chunks with exact query terms that ────────
     #    BM25/cosine may have missed.  We extract significant multi-word phrases
     #    and rare tokens, then inject matching chunks into results.
-    def _keyword_rescue(query: str, fused_scores: dict, already: set, k: int) -> List[dict]:
-        """Return up to k chunks that contain distinctive query terms."""
+    def _keyword_rescue(query: str, already: set, k: int) -> List[dict]:
+        """Return up to k chunks that contain distinctive query terms (best fused score first)."""
         q_lower = query.lower()
         # Extract distinctive tokens (3+ chars, not stopwords)
-        _stop = {"the","and","for","are","was","how","what","when","where","who",
-                 "does","can","they","their","this","that","with","from","have",
-                 "been","will","would","should","could","about","into","than",
-                 "also","just","than","very","much","some","any","all","each",
-                 "which","there","these","those","other","your","after","before",
-                 "between","during","through","above","below","out","off","over",
-                 "under","again","further","then","once","here","why","both","few",
-                 "more","most","such","only","same","too","but","not","own","its",
-                 "our","you","has","had","did","get","got","let","may","use","way",
-                 "try","ask","put","say","take","come","make","like","know","see",
-                 "think","want","give","tell","call","keep","show","turn","move",
-                 "need","still","might","must","shall","upon","onto","within","without",
-                 "along","since","until","while","where","whom","whose"}
-        words = [w for w in re.findall(r'[a-z0-9]+(?:[.\'-][a-z0-9]+)*', q_lower) if len(w) >= 3 and w not in _stop]
+        words = [w for w in _QUERY_WORD_RE.findall(q_lower) if len(w) >= 3 and w not in _STOPWORDS]
         # Also extract quoted phrases, phone numbers, specific patterns
-        phone_nums = re.findall(r'\(\d{3}\)\s*\d{3}[- ]?\d{4}', query)
-        specific_terms = phone_nums + re.findall(r'\b[A-Z]{2,}(?:\s+[A-Z][a-z]+)*\b', query)  # BLUE, FORMER, etc.
-        
-        rescued: List[dict] = []
-        rescued_ids: set = set()
-
-        # Sort candidates by fused score (best first) so highest-relevance chunks win slots
-        candidates_sorted = sorted(
-            [c for c in chunks if c["id"] not in already],
-            key=lambda c: -fused_scores.get(c["id"], 0.0),
-        )
-
-        for c in candidates_sorted:
-            if c["id"] in rescued_ids:
-                continue
-            raw_lower = c["raw_content"].lower()
-            ctx_lower = c.get("contextual_content", "").lower()
-            combined = raw_lower + " " + ctx_lower
-
-            # Check for specific terms first (high value)
-            for term in specific_terms:
-                if term.lower() in combined:
-                    rescued.append(c)
-                    rescued_ids.add(c["id"])
-                    break
-            else:
-                # Check how many query keywords appear in this chunk
-                matches = sum(1 for w in words if w in combined)
-                if matches >= max(2, len(words) // 2):
-                    rescued.append(c)
-                    rescued_ids.add(c["id"])
-
-            if len(rescued) >= k:
-                break
-        
-        return rescued
+        phone_nums = _PHONE_PATTERN.findall(query)
+        specific_terms = phone_nums + _ACRONYM_RE.findall(query)  # BLUE, FORMER, etc.
+        specific_terms_lower = [t.lower() for t in specific_terms]
+        threshold = max(2, len(words) // 2)
+        # Nothing can qualify: too few words to reach the threshold, no specific terms
+        if len(words) < threshold and not specific_terms_lower:
+            return []
+
+        # Rows that qualify, from the rescue index: enough query words, or any
+        # specific term (its words narrow the rows, then an exact substring check)
+        word_hits = np.zeros(len(chunks), dtype=np.intp)
+        word_rows = {w: rows_containing(index, w) for w in set(words)}
+        for w in words:
+            word_hits[word_rows[w]] += 1
+        match = word_hits >= threshold
+        for term in specific_terms_lower:
+            cand = None
+            for w in _QUERY_WORD_RE.findall(term):
+                w_rows = word_rows[w] if w in word_rows else rows_containing(index, w)
+                cand = w_rows if cand is None else np.intersect1d(cand, w_rows, assume_unique=True)
+            for r in ([] if cand is None else cand.tolist()):
+                if not match[r] and term in chunks[r]["combined_lower"]:
+                    match[r] = True
+        # An id shared across documents rescues its first matching chunk
+        match_rows = np.flatnonzero(match)
+        match_keys, first = np.unique(chunk_key[match_rows], return_index=True)
+        rescue_rows = match_rows[first]
+
+        # Matches outside the fusion candidates score as fusion would have
+        # scored them: no BM25 share, their cosine half plus adj
+        scores = key_score[match_keys]
+        extra  = np.flatnonzero(~is_candidate[match_keys])
+        if len(extra):
+            extra_rows = chunk_key_row[match_keys[extra]]
+            if len(dense) == len(chunks):
+                cos = dense[extra_rows]
+            else:   # Hamming path: dense only covers the shortlist
+                scale = None if index.chunk_emb_scale is None else index.chunk_emb_scale[extra_rows]
+                cos = dense_scores(index.chunk_emb_matrix[extra_rows], scale, q_vec)
+            scores[extra] = 0.5 * minmax(cos.astype(np.float64), *cosine[2]) + adj[extra_rows]
+            key_score[match_keys[extra]] = scores[extra]
+
+        # Best fused score first (top_order keeps the ranking's tie order).
+        # At most len(already) of them are skipped, so k + len(already) suffice
+        best    = top_order(scores, k + len(already))
+        rescued = [chunks[r] for r in rescue_rows[best].tolist() if index.chunk_ids[r] not in already]
+        return rescued[:k]
 
     # ── Build results — fused score + keyword rescue ─────────────────────────
     results: List[dict] = []
     result_ids: set = set()
 
     # First: top chunks by fused score
-    for cid in sorted_ids:
-        c = id_to_chunk.get(cid)
-        if not c:
-            continue
+    for pos in ranked:
+        c   = chunks[rows[pos]]
+        cid = c["id"]
         results.append({
             "chunk_id":      c["id"],
             "page_number":   c["page"],
             "section_title": c["section_title"],
             "chunk_content": c["raw_content"],
-            "score":         float(fused[cid]),
+            "score":         float(fused_vals[pos]),
             "document_id":   c["doc_id"],
             "document_name": c["doc_name"],
         })
@@ -924,15 +1582,20 @@ def hybrid_search(query: str, top_k: int = FINAL_TOP_K) -> List[dict]:
             break
 
     # Second: keyword rescue pass — inject chunks with exact query terms
-    # Sorted by fused score so best-matching chunk wins a rescue slot (not just earliest in doc)
-    rescued = _keyword_rescue(query, fused, result_ids, k=5)
+    # Sorted by fused score so best-matching chunk wins a rescue slot (not just earliest in doc).
+    # When the top hit is already strong the scan is skipped and the slots go
+    # to the next chunks by fused score
+    if results and results[0]["score"] >= RESCUE_MAX_SCORE:
+        rescued = [chunks[rows[pos]] for pos in islice(ranked, 5)]
+    else:
+        rescued = _keyword_rescue(query, result_ids, k=5)
     for c in rescued:
         results.append({
             "chunk_id":      c["id"],
             "page_number":   c["page"],
             "section_title": c["section_title"],
             "chunk_content": c["raw_content"],
-            "score":         fused.get(c["id"], 0.0),
+            "score":         fused(c["id"]),
             "document_id":   c["doc_id"],
             "document_name": c["doc_name"],
         })
@@ -941,24 +1604,23 @@ def hybrid_search(query: str, top_k: int = FINAL_TOP_K) -> List[dict]:
             break
 
     # Third: page-level rescue — if top chunk score is weak, add chunks from best pages
-    if results and results[0]["score"] < 0.6 and pages_store:
-        page_results = page_level_search(query, top_k=3)
+    if results and results[0]["score"] < 0.6 and index.pages_store:
+        page_results = page_level_search(query, top_k=3, q_vec=q_vec, index=index)
         page_nums_already = {r["page_number"] for r in results}
         for pr in page_results:
             if pr["page_num"] in page_nums_already:
                 continue
-            # Find all chunks belonging to this page and add the best one
-            page_chunks = [c for c in chunks
-                           if c["page"] == pr["page_num"] and c["doc_id"] == pr["doc_id"]
-                           and c["id"] not in result_ids]
+            # Chunks belonging to this page (O(1) lookup) — add the best one
+            page_chunks = [c for c in index.chunks_by_page.get((pr["doc_id"], pr["page_num"]), ())
+                           if c["id"] not in result_ids]
             if page_chunks:
-                best = max(page_chunks, key=lambda c: fused.get(c["id"], 0.0))
+                best = max(page_chunks, key=lambda c: fused(c["id"]))
                 results.append({
                     "chunk_id":      best["id"],
                     "page_number":   best["page"],
                     "section_title": best["section_title"],
                     "chunk_content": best["raw_content"],
-                    "score":         fused.get(best["id"], 0.0),
+                    "score":         fused(best["id"]),
                     "document_id":   best["doc_id"],
                     "document_name": best["doc_name"],
                 })
@@ -967,11 +1629,68 @@ def hybrid_search(query: str, top_k: int = FINAL_TOP_K) -> List[dict]:
 
     return results
 
+# ─── Query Caches ────────────────────────────────────────────────────────────
+
+class _TTLCache:
+    """
+    Bounded LRU whose entries also expire `ttl_sec` after being stored.
+    Thread-safe — sync endpoints run on FastAPI's thread pool.
+    """
+
+    def __init__(self, max_items: int, ttl_sec: float):
+        self.max_items = max_items
+        self.ttl_sec   = ttl_sec
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_sec:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+RETRIEVE_CACHE_MAX = 512   # distinct (query, top_k) results kept
+RETRIEVE_CACHE_TTL = 60    # seconds — repeats inside a burst skip hybrid_search
+_retrieve_cache = _TTLCache(RETRIEVE_CACHE_MAX, RETRIEVE_CACHE_TTL)
+
 # ─── LLM Reranking ───────────────────────────────────────────────────────────
 
 RERANK_TOP_IN   = 15    # send top N candidates to reranker
 RERANK_TOP_OUT  = 8     # keep top N after reranking
-_rerank_cache: Dict[str, List[tuple]] = {}
+RERANK_CACHE_MAX = 2048 # LRU bound — oldest (query, candidates) entries are evicted past this
+RERANK_CACHE_TTL = 600  # seconds
+_rerank_cache = _TTLCache(RERANK_CACHE_MAX, RERANK_CACHE_TTL)
+_SCORE_RE = re.compile(r'\d+')   # every \d+ match is int()-parseable, Unicode digits included
+RERANK_SNIPPET_CHARS = 400  # leading chars of each passage shown to the reranker
+# The passages come first and the question last: Ollama reuses the KV cache for
+# the longest prompt prefix shared with its previous request, so re-asking over
+# the same candidates only prefills the question.  Chunk text is whitespace-
+# collapsed at parse time, so a chunk's snippet is the same bytes every call
+_RERANK_PROMPT = (
+    "Rate each passage's relevance (1-10) to the question below. Higher = more relevant.\n"
+    "Output ONLY comma-separated numbers, one per passage, in order.\n\n"
+    "{passages}\n\n"
+    'Question: "{query}"\n'
+    "Scores:"
+)
 
 
 def rerank_with_llm(query: str, candidates: List[dict]) -> List[dict]:
@@ -982,26 +1701,23 @@ def rerank_with_llm(query: str, candidates: List[dict]) -> List[dict]:
     if not candidates:
         return candidates
 
-    cache_key = query.strip().lower()
-    if cache_key in _rerank_cache:
-        cached_scores = dict(_rerank_cache[cache_key])
-        for c in candidates:
-            c["rerank_score"] = cached_scores.get(c["chunk_id"], 5)
-        return sorted(candidates, key=lambda x: x.get("rerank_score", 0), reverse=True)[:RERANK_TOP_OUT]
+    n = min(len(candidates), RERANK_TOP_IN)
+    # Scores are only reused for the exact candidate list they were given for
+    # (ids restart per document, so the document id is part of each entry)
+    cache_key = (query.strip().lower(),
+                 tuple((c["document_id"], c["chunk_id"]) for c in candidates[:n]))
+    cached_scores = _rerank_cache.get(cache_key)
+    if cached_scores is not None:
+        for c, score in zip(candidates, cached_scores):
+            c["rerank_score"] = score
+        return sorted(candidates[:n], key=lambda x: x.get("rerank_score", 0), reverse=True)[:RERANK_TOP_OUT]
 
     # Build batch prompt with all passages
-    n = min(len(candidates), RERANK_TOP_IN)
     passages = "\n\n".join(
-        f"[{i+1}] {c['chunk_content'][:400]}"
+        f"[{i+1}] {c['chunk_content'][:RERANK_SNIPPET_CHARS]}"
         for i, c in enumerate(candidates[:n])
     )
-    prompt = (
-        f'Given this question: "{query}"\n\n'
-        f"Rate each passage's relevance (1-10). Higher = more relevant.\n"
-        f"Output ONLY comma-separated numbers, one per passage, in order.\n\n"
-        f"{passages}\n\n"
-        f"Scores:"
-    )
+    prompt = _RERANK_PROMPT.format(passages=passages, query=query)
 
     result = ollama_call(
         [{"role": "user", "content": prompt}],
@@ -1013,26 +1729,15 @@ def rerank_with_llm(query: str, candidates: List[dict]) -> List[dict]:
         return candidates[:RERANK_TOP_OUT]
 
     # Parse scores
-    raw_scores = re.findall(r'\d+', result)
-    scores = []
-    for s in raw_scores[:n]:
-        try:
-            score = min(10, max(1, int(s)))
-        except ValueError:
-            score = 5
-        scores.append(score)
-
+    scores = [min(10, max(1, int(s))) for s in _SCORE_RE.findall(result)[:n]]
     # Pad with neutral score if LLM returned fewer scores
-    while len(scores) < n:
-        scores.append(5)
+    scores += [5] * (n - len(scores))
 
     # Apply scores
-    scored_pairs = []
-    for i, c in enumerate(candidates[:n]):
-        c["rerank_score"] = scores[i]
-        scored_pairs.append((c["chunk_id"], scores[i]))
+    for c, score in zip(candidates, scores):
+        c["rerank_score"] = score
 
-    _rerank_cache[cache_key] = scored_pairs
+    _rerank_cache.set(cache_key, scores)
     log.info("🔄 Reranked %d chunks: scores=%s", n, scores[:n])
 
     reranked = sorted(candidates[:n], key=lambda x: x.get("rerank_score", 0), reverse=True)
@@ -1065,36 +1770,88 @@ class IngestResponse(BaseModel):
 
 # ─── Startup ──────────────────────────────────────────────────────────────────
 
+def load_onnx_embedder() -> SentenceTransformer:
+    """int8 ONNX Runtime embedder, exported into ONNX_DIR on first use."""
+    import onnxruntime as ort
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    file_name = f"onnx/model_qint8_{ONNX_QUANTIZATION}.onnx"
+    if not (ONNX_DIR / file_name).exists():
+        log.info("📦 Exporting %s to int8 ONNX (%s) — one-time", EMBED_MODEL, ONNX_QUANTIZATION)
+        base = SentenceTransformer(EMBED_MODEL, backend="onnx", trust_remote_code=True)
+        base.save(str(ONNX_DIR))
+        export_dynamic_quantized_onnx_model(base, ONNX_QUANTIZATION, str(ONNX_DIR))
+
+    session_options = ort.SessionOptions()
+    session_options.intra_op_num_threads = os.cpu_count() or 1
+    return SentenceTransformer(
+        str(ONNX_DIR), backend="onnx", trust_remote_code=True,
+        model_kwargs={"file_name": file_name, "provider": "CPUExecutionProvider",
+                      "session_options": session_options},
+    )
+
+
+def load_embedder() -> SentenceTransformer:
+    """Bi-encoder on the configured EMBED_BACKEND, falling back to PyTorch."""
+    global embed_backend
+    if EMBED_BACKEND == "onnx":
+        try:
+            model = load_onnx_embedder()
+            embed_backend = f"onnx-{ONNX_QUANTIZATION}"
+            return model
+        except Exception as exc:
+            log.warning("ONNX embedder unavailable (%s) — using PyTorch", exc)
+    embed_backend = "torch"
+    return SentenceTransformer(EMBED_MODEL, trust_remote_code=True)
+
+
 @app.on_event("startup")
 async def startup():
     global embedder
     log.info("🚀 RAG Sidecar v2 starting up...")
-    log.info("🤖 Loading bi-encoder: %s", EMBED_MODEL)
-    embedder = SentenceTransformer(EMBED_MODEL, trust_remote_code=True)
-    log.info("✅ Embedding model loaded (dim=%d)", embedder.get_sentence_embedding_dimension())
+    log.info("🤖 Loading bi-encoder: %s (%s)", EMBED_MODEL, EMBED_BACKEND)
+    embedder = load_embedder()
+    log.info("✅ Embedding model loaded (dim=%d, %s)", embedder.get_sentence_embedding_dimension(), embed_backend)
     ingest_all_docs()
+    # First real query shouldn't pay for lazy kernel / arena setup
+    embedder.encode(["warmup"], normalize_embeddings=False)
 
 # ─── Routes ───────────────────────────────────────────────────────────────────
 
 @app.get("/health")
 def health():
+    chunks = _index.chunks
     doc_names = list({c["doc_name"] for c in chunks})
     return {
         "status":  "ok" if chunks else "loading",
         "chunks":  len(chunks),
         "docs":    doc_names,
         "model":   EMBED_MODEL,
+        "embed_backend": embed_backend,
         "cache_dir": str(CACHE_DIR),
     }
 
 
 @app.post("/retrieve", response_model=RetrieveResponse)
-def retrieve(req: RetrieveRequest):
-    if not chunks:
+async def retrieve(req: RetrieveRequest):
+    index = _index
+    if not index.chunks:
         raise HTTPException(status_code=503, detail="Knowledge base not loaded yet")
     if not req.query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty")
-    results = hybrid_search(req.query, req.top_k)
+    # Keyed on the exact query (ALL-CAPS terms drive keyword rescue, so case
+    # matters) and the version of the snapshot bound above, which is the one
+    # searched even if a re-ingest publishes a new corpus meanwhile
+    cache_key = (req.query, req.top_k, index.version)
+    results = _retrieve_cache.get(cache_key)
+    if results is not None:
+        return RetrieveResponse(results=results, query=req.query)
+    # Cache hits answer on the event loop; the CPU-bound search runs in a
+    # worker thread so concurrent queries don't queue behind it.  The thread
+    # searches the snapshot bound above, never the live globals, so a re-ingest
+    # publishing a new _index meanwhile can't hand it rows from two corpora
+    results = await asyncio.to_thread(hybrid_search, req.query, req.top_k, index)
+    _retrieve_cache.set(cache_key, results)
 
     # LLM Reranking disabled — hybrid search (BM25 + pplx-embed) outperforms
     # 8B reranker (96% vs 51% recall in benchmarks).  Uncomment to re-enable.
@@ -1102,12 +1859,15 @@ def retrieve(req: RetrieveRequest):
     #     results = rerank_with_llm(req.query, results)
 
     # ── DEBUG: Log every chunk returned to the frontend ──
-    log.info("═══ RETRIEVE RESULTS for: '%s' ═══", req.query[:80])
-    for i, r in enumerate(results):
-        log.info("  [%d] score=%.3f | page %d | §%s | doc=%s",
-                 i + 1, r["score"], r["page_number"], r["section_title"], r["document_name"])
-        log.info("      chunk (first 300 chars): %s", r["chunk_content"][:300])
-    log.info("═══ END RESULTS ═══")
+    # Guarded so the per-result arguments (and 300-char slices) aren't built
+    # unless DEBUG logging is on
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("═══ RETRIEVE RESULTS for: '%s' ═══", req.query[:80])
+        for i, r in enumerate(results):
+            log.debug("  [%d] score=%.3f | page %d | §%s | doc=%s",
+                      i + 1, r["score"], r["page_number"], r["section_title"], r["document_name"])
+            log.debug("      chunk (first 300 chars): %s", r["chunk_content"][:300])
+        log.debug("═══ END RESULTS ═══")
     return RetrieveResponse(results=results, query=req.query)
 
 
@@ -1131,6 +1891,7 @@ def ingest(background_tasks: BackgroundTasks):
             _ingesting = False
 
     background_tasks.add_task(_run)
+    chunks = _index.chunks
     return IngestResponse(
         status="ingestion started",
         chunks_total=len(chunks),
@@ -1142,7 +1903,7 @@ def ingest(background_tasks: BackgroundTasks):
 def list_docs():
     """List all indexed documents."""
     seen: dict[str, dict] = {}
-    for c in chunks:
+    for c in _index.chunks:
         if c["doc_id"] not in seen:
             seen[c["doc_id"]] = {"doc_id": c["doc_id"], "doc_name": c["doc_name"], "chunks": 0}
         seen[c["doc_id"]]["chunks"] += 1
@@ -1159,7 +1920,7 @@ def list_chunks():
         "title": c["section_title"],
         "words": len(c["raw_content"].split()),
         "ctx":   c.get("contextual_content", "")[:150],
-    } for c in chunks]
+    } for c in _index.chunks]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1167,18 +1928,68 @@ def list_chunks():
 # Two-pass scoring: deterministic pre-score (all rows) → Ollama AI enrichment (top N)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-VOTER_CACHE_PATH = CACHE_DIR / "voter-scores.json"
+# Scored-candidate cache: one immutable directory per saved version (a .npy per
+# column + stats.json), and a CURRENT file naming the live one.  Kept out of
+# CACHE_DIR's top level, which clean_stale_cache sweeps
+VOTER_CACHE_DIR    = CACHE_DIR / "voter-scores"
+VOTER_CURRENT_PATH = VOTER_CACHE_DIR / "CURRENT"
+VOTER_STATS_NAME   = "stats.json"
 VOTER_CSV_PATH   = CACHE_DIR / "voters.csv"
 AI_ENRICH_TOP_N  = 100       # how many top candidates get Ollama AI reasons
 AI_BATCH_SIZE    = 10        # candidates per Ollama call
+AI_MAX_CONCURRENCY = int(os.environ.get("AI_MAX_CONCURRENCY", "4"))  # Ollama calls in flight at once
+
+# One "N. SCORE: <n> | REASON: <text>" line of an enrichment response
+_ENRICH_LINE_RE = re.compile(
+    r'^[ \t]*(\d+)\.[ \t]*SCORE:[ \t]*(\d+)[ \t]*\|[ \t]*REASON:[ \t]*(.+?)[ \t]*$',
+    re.MULTILINE
+)
 
 # ─── In-memory voter store ────────────────────────────────────────────────────
 
 voter_records: List[Dict[str, Any]]    = []   # raw parsed CSV rows
-scored_voters: List[Dict[str, Any]]    = []   # scored + sorted candidates
 _voter_scoring = False                        # guard against concurrent scoring
 _voter_stats: Dict[str, Any]           = {}   # cached summary stats
 
+_NO_ROWS = np.empty(0, dtype=np.int32)
+
+
+@dataclass(frozen=True, eq=False)
+class _VoterView:
+    """
+    Scored candidates, stored column-wise only (row i = i-th best candidate),
+    plus every filter column + index derived from them.  Rebuilt whole and
+    published by a single assignment to `_view`, so a request that binds
+    `_view` once sees one coherent scored set even if a reload lands mid-request.
+    """
+    # Cache version (voter-scores/CURRENT) the columns were loaded from.  Shared
+    # by every uvicorn worker, so ETags built from it mean the same data in each
+    version: str = ""
+    table: Dict[str, Any] = field(default_factory=dict)   # columns (arrays / _TextColumn); per-row dicts built on demand
+    ages:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    scores: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int16))
+    # Boolean filters as np.packbits bitmaps (bit i of the big-endian stream = row i)
+    prev_bits: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))   # previousPollWorker
+    bi_bits:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))   # speaks 2+ languages
+    name_rank: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))   # dense rank of name.lower()
+    # Languages as bitmasks: bit lang_vocab[l] of row i is set when voter i
+    # speaks l.  One uint64 word per 64 languages (a single word in practice)
+    lang_vocab: Dict[str, int] = field(default_factory=dict)
+    lang_bits:  np.ndarray = field(default_factory=lambda: np.empty((0, 1), dtype=np.uint64))
+    # Inverted indexes: value → sorted int32 row ids having it
+    city_index:     Dict[str, np.ndarray] = field(default_factory=dict)
+    precinct_index: Dict[str, np.ndarray] = field(default_factory=dict)
+    # Range-filter indexes: row ids ordered by value, plus the values in that order
+    age_order:     np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    ages_sorted:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    score_order:   np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    scores_sorted: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int16))
+
+
+_view = _VoterView()
+_voter_cache_version = ""  # cache version (CURRENT) last loaded from disk
+_voter_reload_lock = threading.Lock()  # serializes cache reloads (requests vs. scoring callback)
+
 
 REQUIRED_CSV_COLUMNS = {
     "id", "first_name", "last_name", "age", "city", "precinct",
@@ -1209,12 +2020,44 @@ def parse_voter_csv(raw_text: str) -> List[Dict[str, Any]]:
         # Normalize boolean
         ppw = row.get("previous_poll_worker", "").lower()
         row["previous_poll_worker"] = ppw in ("true", "1", "yes")
+        # Parse registration date once at load (0 = missing/unparseable)
+        try:
+            row["_reg_year"] = date.fromisoformat(row.get("registered_since", "")).year
+        except (ValueError, TypeError):
+            row["_reg_year"] = 0
         rows.append(row)
 
     return rows
 
 
-def is_eligible(voter: Dict[str, Any]) -> bool:
+def voter_columns(voters: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Pivot parsed CSV rows into column arrays so eligibility and scoring run as
+    vectorized NumPy expressions instead of per-row Python calls.
+    A reg_year of 0 means the registration date was missing or unparseable.
+    """
+    n = len(voters)
+    langs = [v.get("languages", "").strip() for v in voters]
+    return {
+        "age":           np.fromiter((v.get("age", 0) for v in voters), dtype=np.int32, count=n),
+        "has_name":      np.fromiter((bool(v.get("first_name") and v.get("last_name")) for v in voters), dtype=bool, count=n),
+        "has_location":  np.fromiter((bool(v.get("city") and v.get("precinct")) for v in voters), dtype=bool, count=n),
+        "has_languages": np.fromiter((bool(l) for l in langs), dtype=bool, count=n),
+        "bilingual":     np.fromiter(("," in l for l in langs), dtype=bool, count=n),
+        "lang_count":    np.fromiter((sum(1 for x in l.split(",") if x.strip()) for l in langs), dtype=np.int32, count=n),
+        "experienced":   np.fromiter((bool(v.get("previous_poll_worker")) for v in voters), dtype=bool, count=n),
+        "available":     np.fromiter((v.get("availability", "").lower() == "available" for v in voters), dtype=bool, count=n),
+        "reg_year":      np.fromiter((v.get("_reg_year", 0) for v in voters), dtype=np.int32, count=n),
+    }
+
+
+def years_registered(cols: Dict[str, np.ndarray], current_year: int) -> np.ndarray:
+    """Years since registration per row (0 where the date was unparseable)."""
+    reg_year = cols["reg_year"]
+    return np.where(reg_year > 0, current_year - reg_year, 0)
+
+
+def eligibility_mask(cols: Dict[str, np.ndarray], current_year: int) -> np.ndarray:
     """
     Rigorous tiered eligibility filter.  A candidate must pass hard requirements
     AND qualify through one of three tiers.  Designed to keep the pool at
@@ -1225,104 +2068,73 @@ def is_eligible(voter: Dict[str, Any]) -> bool:
       2. Experienced + registered 8yr+ + age 28-62
       3. Bilingual  + registered 10yr+ + age 28-60
     """
-    # ── Hard requirements (instant reject) ──────────────────────────────────
-    age = voter.get("age", 0)
-    if age < 25 or age > 68:
-        return False
+    age = cols["age"]
+    years = years_registered(cols, current_year)
+    bilingual = cols["bilingual"]
+    experienced = cols["experienced"]
 
-    if not voter.get("first_name") or not voter.get("last_name"):
-        return False
-    if not voter.get("city") or not voter.get("precinct"):
-        return False
-
-    languages = voter.get("languages", "").strip()
-    if not languages:
-        return False
-
-    reg_date_str = voter.get("registered_since", "")
-    try:
-        reg_year = datetime.strptime(reg_date_str, "%Y-%m-%d").year
-        years_registered = datetime.now().year - reg_year
-    except (ValueError, TypeError):
-        return False
-
-    if years_registered < 3:
-        return False
-
-    # ── Derived flags ───────────────────────────────────────────────────────
-    is_bilingual = "," in languages
-    is_experienced = bool(voter.get("previous_poll_worker"))
+    # ── Hard requirements (instant reject) ──────────────────────────────────
+    hard = (
+        (age >= 25) & (age <= 68)
+        & cols["has_name"] & cols["has_location"] & cols["has_languages"]
+        & (cols["reg_year"] > 0) & (years >= 3)
+    )
 
     # ── Tier 1: bilingual AND experienced → always qualifies ───────────────
-    if is_experienced and is_bilingual:
-        return True
-
+    tier1 = experienced & bilingual
     # ── Tier 2: experienced + long registration + prime age ────────────────
-    if is_experienced and years_registered >= 8 and 28 <= age <= 62:
-        return True
-
+    tier2 = experienced & (years >= 8) & (age >= 28) & (age <= 62)
     # ── Tier 3: bilingual + very long registration + prime age ─────────────
-    if is_bilingual and years_registered >= 10 and 28 <= age <= 60:
-        return True
+    tier3 = bilingual & (years >= 10) & (age >= 28) & (age <= 60)
 
-    return False
+    return hard & (tier1 | tier2 | tier3)
 
 
-def deterministic_score(voter: Dict[str, Any]) -> Dict[str, Any]:
+def deterministic_scores(cols: Dict[str, np.ndarray], current_year: int) -> np.ndarray:
     """
-    Pass 1: Fast rule-based scoring. Returns score (0-100) + list of reason fragments.
-    Runs on ALL rows instantly.
+    Pass 1: Fast rule-based scoring (0-100) for every row in one vectorized pass.
+    Reason text is built separately by score_reasons, only for eligible rows.
     """
-    score = 40
+    age = cols["age"]
+    years = years_registered(cols, current_year)
+    score = (
+        40
+        + 25 * cols["experienced"]                      # previous poll worker → strongest signal
+        + 15 * (cols["lang_count"] > 1)                 # bilingual
+        + np.where(years >= 10, 10, np.where(years >= 5, 7, 0))  # registration longevity
+        + 5 * cols["available"]
+        + np.where((age >= 25) & (age <= 65), 5, np.where((age >= 18) & (age < 25), 3, 0))
+    )
+    return np.minimum(score, 100)
+
+
+def score_reasons(voter: Dict[str, Any], years: int) -> List[str]:
+    """Human-readable reason fragments matching the terms in deterministic_scores."""
     reasons: List[str] = []
 
-    # Previous poll worker experience → strongest signal
     if voter.get("previous_poll_worker"):
-        score += 25
         reasons.append("prior poll worker experience")
 
-    # Bilingual
     langs = [l.strip() for l in voter.get("languages", "").split(",") if l.strip()]
     if len(langs) > 1:
-        score += 15
         non_english = [l for l in langs if l.lower() != "english"]
         reasons.append(f"bilingual ({', '.join(non_english)})")
 
-    # Registration longevity
-    reg_date_str = voter.get("registered_since", "")
-    years_registered = 0
-    if reg_date_str:
-        try:
-            reg_year = datetime.strptime(reg_date_str, "%Y-%m-%d").year
-            years_registered = datetime.now().year - reg_year
-            if years_registered >= 10:
-                score += 10
-                reasons.append(f"registered {years_registered} years (high civic engagement)")
-            elif years_registered >= 5:
-                score += 7
-                reasons.append(f"registered {years_registered} years")
-        except ValueError:
-            pass
-
-    # Availability
+    if years >= 10:
+        reasons.append(f"registered {years} years (high civic engagement)")
+    elif years >= 5:
+        reasons.append(f"registered {years} years")
+
     if voter.get("availability", "").lower() == "available":
-        score += 5
         reasons.append("marked available")
 
-    # Prime working age bonus
     age = voter.get("age", 0)
     if 25 <= age <= 65:
-        score += 5
         reasons.append(f"age {age} (prime working range)")
     elif 18 <= age < 25:
-        score += 3
         reasons.append(f"age {age} (young voter engagement)")
 
-    return {
-        "score": min(score, 100),
-        "reasons": reasons,
-        "reason_text": ", ".join(reasons) if reasons else "meets basic eligibility",
-    }
+    return reasons
 
 
 def build_candidate(voter: Dict[str, Any], score_data: Dict[str, Any], ai_enriched: bool = False) -> Dict[str, Any]:
@@ -1351,10 +2163,36 @@ def build_candidate(voter: Dict[str, Any], score_data: Dict[str, Any], ai_enrich
     }
 
 
+def build_enrich_prompt(batch: List[Dict[str, Any]]) -> str:
+    """Build a single prompt with all candidates in one enrichment batch."""
+    profiles = []
+    for j, c in enumerate(batch):
+        profiles.append(
+            f"{j+1}. {c['name']}, age {c['age']}, {c['city']} ({c['precinct']}), "
+            f"languages: {', '.join(c['languages'])}, "
+            f"registered since: {c['registeredSince']}, "
+            f"previous poll worker: {'yes' if c['previousPollWorker'] else 'no'}, "
+            f"current score: {c['aiScore']}"
+        )
+
+    return (
+        "You are an election official AI assistant evaluating poll worker candidates.\n"
+        "For each candidate below, provide a REFINED score (0-100) and a brief 1-sentence reason "
+        "explaining why they would be a good or poor poll worker.\n"
+        "Consider: civic engagement, bilingual ability, experience, age diversity, and availability.\n\n"
+        "Candidates:\n" + "\n".join(profiles) + "\n\n"
+        "Respond ONLY in this exact format, one line per candidate:\n"
+        "1. SCORE: <number> | REASON: <one sentence>\n"
+        "2. SCORE: <number> | REASON: <one sentence>\n"
+        "... and so on. No other text."
+    )
+
+
 def ai_enrich_batch(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Pass 2: Use Ollama to generate refined scores + natural-language reasons
     for a batch of top candidates. Only called for top N candidates.
+    Batches are sent concurrently (up to AI_MAX_CONCURRENCY in flight).
     """
     if not is_ollama_up():
         log.info("⚠️  Ollama not available — skipping AI enrichment")
@@ -1362,45 +2200,27 @@ def ai_enrich_batch(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
     log.info("🧠 AI-enriching %d candidates via Ollama...", len(candidates))
     enriched = 0
+    done = 0
 
-    for i in range(0, len(candidates), AI_BATCH_SIZE):
-        batch = candidates[i:i + AI_BATCH_SIZE]
-
-        # Build a single prompt with all candidates in this batch
-        profiles = []
-        for j, c in enumerate(batch):
-            profiles.append(
-                f"{j+1}. {c['name']}, age {c['age']}, {c['city']} ({c['precinct']}), "
-                f"languages: {', '.join(c['languages'])}, "
-                f"registered since: {c['registeredSince']}, "
-                f"previous poll worker: {'yes' if c['previousPollWorker'] else 'no'}, "
-                f"current score: {c['aiScore']}"
-            )
+    batches = [candidates[i:i + AI_BATCH_SIZE] for i in range(0, len(candidates), AI_BATCH_SIZE)]
 
-        prompt = (
-            "You are an election official AI assistant evaluating poll worker candidates.\n"
-            "For each candidate below, provide a REFINED score (0-100) and a brief 1-sentence reason "
-            "explaining why they would be a good or poor poll worker.\n"
-            "Consider: civic engagement, bilingual ability, experience, age diversity, and availability.\n\n"
-            "Candidates:\n" + "\n".join(profiles) + "\n\n"
-            "Respond ONLY in this exact format, one line per candidate:\n"
-            "1. SCORE: <number> | REASON: <one sentence>\n"
-            "2. SCORE: <number> | REASON: <one sentence>\n"
-            "... and so on. No other text."
-        )
+    def _call(batch: List[Dict[str, Any]]) -> Optional[str]:
+        return ollama_call([{"role": "user", "content": build_enrich_prompt(batch)}], max_tokens=500)
 
-        result = ollama_call([{"role": "user", "content": prompt}], max_tokens=500)
-        if not result:
-            continue
+    with ThreadPoolExecutor(max_workers=AI_MAX_CONCURRENCY) as pool:
+        futures = {pool.submit(_call, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
+            done += len(batch)
+            result = future.result()
+            if not result:
+                continue
 
-        # Parse the response
-        lines = result.strip().split("\n")
-        for line in lines:
-            match = re.match(r"(\d+)\.\s*SCORE:\s*(\d+)\s*\|\s*REASON:\s*(.+)", line.strip())
-            if match:
+            # Parse the response — single pass over all lines
+            for match in _ENRICH_LINE_RE.finditer(result):
                 idx = int(match.group(1)) - 1
                 ai_score = int(match.group(2))
-                ai_reason = match.group(3).strip()
+                ai_reason = match.group(3)
                 if 0 <= idx < len(batch):
                     # Blend: 40% deterministic + 60% AI
                     blended = round(0.4 * batch[idx]["aiScore"] + 0.6 * min(ai_score, 100))
@@ -1409,42 +2229,63 @@ def ai_enrich_batch(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                     batch[idx]["aiEnriched"] = True
                     enriched += 1
 
-        if (i + AI_BATCH_SIZE) < len(candidates):
-            log.info("  AI enriched: %d/%d done", min(i + AI_BATCH_SIZE, len(candidates)), len(candidates))
+            if done < len(candidates):
+                log.info("  AI enriched: %d/%d done", done, len(candidates))
 
     log.info("✅ AI enrichment complete — %d/%d candidates enriched", enriched, len(candidates))
     return candidates
 
 
-def score_all_voters() -> None:
-    """Full scoring pipeline: eligibility filter → deterministic pre-score → sort → AI enrich top N → cache."""
-    global scored_voters, _voter_stats
-
+def score_all_voters(voter_records: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Full scoring pipeline: eligibility filter → deterministic pre-score → sort →
+    AI enrich top N.  Returns the candidate columns and stats (None without
+    records); it touches no in-memory state, so the parent — not the scoring
+    process — saves, indexes and publishes them.
+    """
     if not voter_records:
         log.warning("No voter records loaded — nothing to score")
-        return
+        return None
 
     log.info("📊 Processing %d voter records...", len(voter_records))
     t0 = time.time()
 
-    # Filter eligible voters first
-    eligible_voters = [v for v in voter_records if is_eligible(v)]
-    log.info("✅ %d eligible voters identified from %d total records", len(eligible_voters), len(voter_records))
+    # Filter eligible voters first — one columnar pass over the whole table
+    current_year = date.today().year
+    cols = voter_columns(voter_records)
+    eligible_idx = np.flatnonzero(eligibility_mask(cols, current_year))
+    log.info("✅ %d eligible voters identified from %d total records", len(eligible_idx), len(voter_records))
     
-    if not eligible_voters:
+    if len(eligible_idx) == 0:
         log.warning("No eligible voters found")
-        scored_voters = []
-        return
+        return candidate_columns([]), candidate_stats([], len(voter_records), 0)
 
-    # Pass 1: deterministic scoring (only on eligible)
+    # Pass 1: deterministic scoring (vectorized; reasons only for eligible rows)
+    scores = deterministic_scores(cols, current_year)
+    years = years_registered(cols, current_year)
     all_candidates: List[Dict[str, Any]] = []
-    for v in eligible_voters:
-        sd = deterministic_score(v)
+    for i in eligible_idx.tolist():
+        v = voter_records[i]
+        reasons = score_reasons(v, int(years[i]))
+        sd = {
+            "score": int(scores[i]),
+            "reasons": reasons,
+            "reason_text": ", ".join(reasons) if reasons else "meets basic eligibility",
+        }
         all_candidates.append(build_candidate(v, sd))
 
     # Sort by score descending
     all_candidates.sort(key=lambda c: -c["aiScore"])
 
+    # Flush the deterministic ranking to disk now — enrichment can take minutes,
+    # and /score-voters serves whatever is on disk while scoring is still running
+    # (the only write a scoring process makes; refresh_voter_cache picks it up)
+    if is_ollama_up():
+        save_voter_cache(
+            candidate_columns(all_candidates),
+            candidate_stats(all_candidates, len(voter_records), len(eligible_idx)),
+        )
+
     # Pass 2: AI enrich top N
     top_n = all_candidates[:AI_ENRICH_TOP_N]
     top_n = ai_enrich_batch(top_n)
@@ -1453,38 +2294,28 @@ def score_all_voters() -> None:
     all_candidates[:AI_ENRICH_TOP_N] = top_n
     all_candidates.sort(key=lambda c: -c["aiScore"])
 
-    scored_voters = all_candidates
     elapsed = time.time() - t0
-    log.info("✅ Scoring complete in %.1fs — %d candidates scored", elapsed, len(scored_voters))
-
-    # Compute stats
-    cities = {}
-    precincts = {}
-    lang_set = set()
-    bilingual_count = 0
-    experienced_count = 0
-    avg_score = 0
-
-    for c in scored_voters:
-        cities[c["city"]] = cities.get(c["city"], 0) + 1
-        precincts[c["precinct"]] = precincts.get(c["precinct"], 0) + 1
-        for l in c["languages"]:
-            lang_set.add(l)
-        if len(c["languages"]) > 1:
-            bilingual_count += 1
-        if c["previousPollWorker"]:
-            experienced_count += 1
-        avg_score += c["aiScore"]
-
-    avg_score = avg_score / len(scored_voters) if scored_voters else 0
-
-    _voter_stats = {
+    log.info("✅ Scoring complete in %.1fs — %d candidates scored", elapsed, len(all_candidates))
+    return (candidate_columns(all_candidates),
+            candidate_stats(all_candidates, len(voter_records), len(eligible_idx)))
+
+
+def candidate_stats(candidates: List[Dict[str, Any]], total_records: int, eligible_count: int) -> Dict[str, Any]:
+    """Summary stats served by /voter-stats."""
+    cities = dict(Counter(c["city"] for c in candidates))
+    precincts = dict(Counter(c["precinct"] for c in candidates))
+    lang_set = set(chain.from_iterable(c["languages"] for c in candidates))
+    bilingual_count = sum(1 for c in candidates if len(c["languages"]) > 1)
+    experienced_count = sum(1 for c in candidates if c["previousPollWorker"])
+    avg_score = fmean(c["aiScore"] for c in candidates) if candidates else 0.0
+
+    return {
         "loaded": True,
         "scoring": False,
-        "totalRecords": len(voter_records),
-        "totalScored": len(scored_voters),  # Only eligible voters are scored
-        "eligibleCount": len(eligible_voters),
-        "aiEnrichedCount": sum(1 for c in scored_voters if c.get("aiEnriched")),
+        "totalRecords": total_records,
+        "totalScored": len(candidates),  # Only eligible voters are scored
+        "eligibleCount": eligible_count,
+        "aiEnrichedCount": sum(1 for c in candidates if c.get("aiEnriched")),
         "bilingualCount": bilingual_count,
         "experiencedCount": experienced_count,
         "avgScore": round(avg_score, 1),
@@ -1495,24 +2326,391 @@ def score_all_voters() -> None:
         "languages": sorted(lang_set),
     }
 
-    # Cache to disk
+
+def _group_rows(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """value → ascending int32 row ids holding it (one vectorized group-by)."""
+    keys, inverse = np.unique(values, return_inverse=True)
+    rows = np.argsort(inverse, kind="stable").astype(np.int32)
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1]
+    return {str(k): r for k, r in zip(keys.tolist(), np.split(rows, bounds))}
+
+
+def index_voter_columns(columns: Dict[str, Any], version: str = "") -> None:
+    """Build and publish a new view (filter columns + postings) from the columnar candidate table."""
+    lang_rows = [[l for l in joined.split(",") if l] for joined in columns["languages"].tolist()]
+    vocab = {l: b for b, l in enumerate(sorted(set(chain.from_iterable(lang_rows))))}
+    pairs = [(i, vocab[l]) for i, row_langs in enumerate(lang_rows) for l in row_langs]
+    bits = np.zeros((len(lang_rows), max(1, -(-len(vocab) // 64))), dtype=np.uint64)
+    if pairs:
+        rows, bit = np.array(pairs, dtype=np.int64).T
+        np.bitwise_or.at(bits, (rows, bit // 64), np.left_shift(np.uint64(1), (bit % 64).astype(np.uint64)))
+
+    ages   = np.asarray(columns["age"], dtype=np.int32)
+    scores = np.asarray(columns["aiScore"], dtype=np.int16)
+    age_order   = np.argsort(ages, kind="stable").astype(np.int32)
+    score_order = np.argsort(scores, kind="stable").astype(np.int32)
+    publish_voter_view(_VoterView(
+        version        = version,
+        table          = columns,
+        ages           = ages,
+        scores         = scores,
+        prev_bits      = np.packbits(np.asarray(columns["previousPollWorker"], dtype=bool)),
+        bi_bits        = np.packbits(np.fromiter((len(r) > 1 for r in lang_rows), dtype=bool, count=len(lang_rows))),
+        name_rank      = np.unique([n.lower() for n in columns["name"].tolist()], return_inverse=True)[1].astype(np.int32),
+        lang_vocab     = vocab,
+        lang_bits      = bits,
+        city_index     = _group_rows(columns["city"]),
+        precinct_index = _group_rows(columns["precinct"]),
+        age_order      = age_order,
+        ages_sorted    = ages[age_order],
+        score_order    = score_order,
+        scores_sorted  = scores[score_order],
+    ))
+
+
+def publish_voter_view(view: _VoterView) -> None:
+    """Swap in a new snapshot; cached filter results pin the old one, so drop them."""
+    global _view
+    _view = view
+    _filtered_sorted_idx.cache_clear()
+
+
+def scored_count() -> int:
+    """Number of scored candidates currently loaded."""
+    return len(_view.scores)
+
+
+def _page_rows(view: _VoterView, rows: np.ndarray) -> List[Dict[str, Any]]:
+    """Materialize candidate dicts (API shape) for one page — one gather + tolist per column."""
+    columns = [col.take(rows) if isinstance(col, _TextColumn) else col[rows].tolist()
+               for col in (view.table[k] for k in _CANDIDATE_FIELDS)]
+    page = [dict(zip(_CANDIDATE_FIELDS, values)) for values in zip(*columns)]
+    for row in page:
+        row["languages"] = [l for l in row["languages"].split(",") if l]
+    return page
+
+
+def _range_rows(order: np.ndarray, sorted_vals: np.ndarray, lo: Optional[int], hi: Optional[int]) -> np.ndarray:
+    """Ascending row ids whose value lies in [lo, hi] — two binary searches, no scan."""
+    start = 0 if lo is None else np.searchsorted(sorted_vals, lo, side="left")
+    stop = len(sorted_vals) if hi is None else np.searchsorted(sorted_vals, hi, side="right")
+    return np.sort(order[start:stop])
+
+
+if _NUMBA_AVAILABLE:
+    @njit(nogil=True)
+    def _filter_rows_kernel(idx, ages, scores, prev_bits, bi_bits, lang_bits, req_bits,
+                            min_age, max_age, min_score, exp_only, bi_only, use_langs):
+        """All scalar + language predicates in one sweep; survivors keep idx order."""
+        out = np.empty(len(idx), dtype=np.int64)
+        n = 0
+        for j in range(len(idx)):
+            i = idx[j]
+            if ages[i] < min_age or ages[i] > max_age or scores[i] < min_score:
+                continue
+            shift = 7 - (i & 7)
+            if exp_only and not (prev_bits[i >> 3] >> shift) & 1:
+                continue
+            if bi_only and not (bi_bits[i >> 3] >> shift) & 1:
+                continue
+            if use_langs:
+                hit = False
+                for w in range(req_bits.shape[0]):
+                    if lang_bits[i, w] & req_bits[w]:
+                        hit = True
+                        break
+                if not hit:
+                    continue
+            out[n] = i
+            n += 1
+        return out[:n]
+
+
+def _flag_set(bits: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Read packed flag bits for the given row ids."""
+    return ((bits[idx >> 3] >> (7 - (idx & 7))) & 1).astype(bool)
+
+
+def _stable_argsort(keys: np.ndarray, reverse: bool) -> np.ndarray:
+    """argsort with list.sort(reverse=...) semantics — ties keep their original order."""
+    if not reverse:
+        return np.argsort(keys, kind="stable")
+    n = len(keys)
+    return (n - 1 - np.argsort(keys[::-1], kind="stable"))[::-1]
+
+
+def _selected(value: Union[str, List[str], None]) -> tuple:
+    """Normalize a city/precinct filter (one value or a multi-select list); "All" selects nothing."""
+    values = [value] if isinstance(value, str) else value or ()
+    return tuple(sorted({v for v in values if v and v != "All"}))
+
+
+def _union_rows(index: Dict[str, np.ndarray], values: tuple) -> np.ndarray:
+    """Ascending row ids holding any of `values`."""
+    if len(values) == 1:
+        return index.get(values[0], _NO_ROWS)
+    return np.unique(np.concatenate([index.get(v, _NO_ROWS) for v in values]))
+
+
+@lru_cache(maxsize=128)
+def _filtered_sorted_idx(
+    view: _VoterView,
+    cities: tuple,
+    precincts: tuple,
+    languages: tuple,
+    min_age: Optional[int],
+    max_age: Optional[int],
+    min_score: Optional[int],
+    experienced_only: bool,
+    bilingual_only: bool,
+    sort_by: str,
+    sort_dir: str,
+) -> np.ndarray:
+    """
+    Row ids matching a filter signature, in display order.  Cached per view
+    (identity-hashed; the cache is cleared whenever a new one is published),
+    so paging through the same filters is a slice.
+    """
+    # Categorical filters — intersect precomputed row-id postings
+    rows: Optional[np.ndarray] = None   # None = every row
+    if cities:
+        rows = _union_rows(view.city_index, cities)
+    if precincts:
+        hits = _union_rows(view.precinct_index, precincts)
+        rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+    if rows is None:
+        # No postings narrowed the set — AND whole flag bitmaps (8 rows per
+        # byte), and let the sorted columns answer range filters by binary
+        # search instead of masking all N rows
+        if experienced_only or bilingual_only:
+            acc = np.full(len(view.prev_bits), 0xFF, dtype=np.uint8)
+            if experienced_only:
+                acc &= view.prev_bits
+            if bilingual_only:
+                acc &= view.bi_bits
+            rows = np.flatnonzero(np.unpackbits(acc, count=len(view.ages))).astype(np.int32)
+            experienced_only = bilingual_only = False
+        if min_age is not None or max_age is not None:
+            hits = _range_rows(view.age_order, view.ages_sorted, min_age, max_age)
+            rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+            min_age = max_age = None
+        if min_score is not None:
+            hits = _range_rows(view.score_order, view.scores_sorted, min_score, None)
+            rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+            min_score = None
+    idx = np.arange(len(view.ages)) if rows is None else rows
+
+    req_bits = np.zeros(view.lang_bits.shape[1], dtype=np.uint64)
+    for l in languages:
+        if l in view.lang_vocab:
+            b = view.lang_vocab[l]
+            req_bits[b // 64] |= np.uint64(1 << (b % 64))
+
+    if _NUMBA_AVAILABLE:
+        # Fused kernel — no per-predicate temporary masks
+        idx = _filter_rows_kernel(
+            idx, view.ages, view.scores, view.prev_bits, view.bi_bits, view.lang_bits, req_bits,
+            -2**31 if min_age is None else min_age,
+            2**31 - 1 if max_age is None else max_age,
+            -2**15 if min_score is None else min_score,
+            experienced_only, bilingual_only, bool(languages),
+        )
+    else:
+        # Scalar filters — one boolean mask over the (usually much smaller) subset
+        mask = np.ones(len(idx), dtype=bool)
+        if min_age is not None:
+            mask &= view.ages[idx] >= min_age
+        if max_age is not None:
+            mask &= view.ages[idx] <= max_age
+        if min_score is not None:
+            mask &= view.scores[idx] >= min_score
+        if experienced_only:
+            mask &= _flag_set(view.prev_bits, idx)
+        if bilingual_only:
+            mask &= _flag_set(view.bi_bits, idx)
+        if languages:
+            # Speaks any requested language — one AND over the packed bitmasks
+            mask &= (view.lang_bits[idx] & req_bits).any(axis=1)
+        idx = idx[mask]
+
+    # Sort
+    reverse = sort_dir == "desc"
+    if sort_by == "aiScore":
+        order = _stable_argsort(view.scores[idx], reverse)
+    elif sort_by == "age":
+        order = _stable_argsort(view.ages[idx], reverse)
+    elif sort_by == "name":
+        order = _stable_argsort(view.name_rank[idx], reverse)
+    else:
+        order = _stable_argsort(view.scores[idx], True)
+
+    result = idx[order]
+    result.flags.writeable = False   # shared by every cache hit
+    return result
+
+
+# ─── Voter cache (one .npy per column + stats JSON) ──────────────────────────
+
+# Short / categorical fields stored as fixed-width unicode columns; "languages" is joined on ","
+_VOTER_STR_COLUMNS = (
+    "id", "city", "precinct", "zip", "languages", "registeredSince", "party", "phone", "availability",
+)
+# Free text of unbounded length (one long AI reason would widen a whole <U
+# column), stored as a _TextColumn
+_VOTER_TEXT_COLUMNS = ("firstName", "lastName", "name", "address", "email", "aiReason")
+_VOTER_NUM_COLUMNS = {
+    "age":                np.int32,
+    "aiScore":            np.int16,
+    "previousPollWorker": np.bool_,
+    "aiEnriched":         np.bool_,
+}
+_VOTER_COLUMNS = _VOTER_STR_COLUMNS + _VOTER_TEXT_COLUMNS + tuple(_VOTER_NUM_COLUMNS)
+# Same fields in the key order build_candidate produces
+_CANDIDATE_FIELDS = (
+    "id", "firstName", "lastName", "name", "age", "address", "city", "precinct", "zip",
+    "languages", "registeredSince", "party", "email", "phone", "previousPollWorker",
+    "availability", "aiScore", "aiReason", "aiEnriched",
+)
+
+
+@dataclass(frozen=True, eq=False)
+class _TextColumn:
+    """
+    Variable-length strings as one concatenated UTF-8 buffer plus int64 offsets
+    (row i = data[offsets[i]:offsets[i + 1]]) — each row costs its own length,
+    not the column's longest.  Both arrays are saved as .npy and memory-mapped.
+    """
+    offsets: np.ndarray
+    data:    np.ndarray   # uint8
+
+    @classmethod
+    def from_strings(cls, values: List[str]) -> "_TextColumn":
+        encoded = [v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return cls(offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def take(self, rows: np.ndarray) -> List[str]:
+        """Decoded strings of `rows`, in order."""
+        starts = self.offsets[rows].tolist()
+        ends = self.offsets[np.asarray(rows) + 1].tolist()
+        data = self.data
+        return [data[a:b].tobytes().decode("utf-8") for a, b in zip(starts, ends)]
+
+    def tolist(self) -> List[str]:
+        return self.take(np.arange(len(self)))
+
+
+def candidate_columns(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Pivot candidate dicts into one typed array (or _TextColumn) per field."""
+    columns: Dict[str, Any] = {}
+    for key in _VOTER_STR_COLUMNS:
+        if key == "languages":
+            values = [",".join(c["languages"]) for c in candidates]
+        else:
+            values = [str(c.get(key, "")) for c in candidates]
+        columns[key] = np.array(values, dtype=str)
+    for key in _VOTER_TEXT_COLUMNS:
+        columns[key] = _TextColumn.from_strings([str(c.get(key, "")) for c in candidates])
+    for key, dtype in _VOTER_NUM_COLUMNS.items():
+        columns[key] = np.fromiter((c.get(key, 0) for c in candidates), dtype=dtype, count=len(candidates))
+    return columns
+
+
+def save_voter_cache(columns: Dict[str, Any], stats: Dict[str, Any]) -> None:
+    """
+    Persist each column as its own .npy (so loads can memory-map them) plus the
+    stats dict as JSON, into a new version directory, then point CURRENT at it.
+    Versions are never modified after CURRENT names them, so a reader always
+    sees one complete version; superseded ones are deleted (live memory maps
+    of their files stay valid).
+    """
     try:
-        serialisable = []
-        for c in scored_voters:
-            serialisable.append(c)
-        VOTER_CACHE_PATH.write_text(json.dumps({
-            "stats": _voter_stats,
-            "candidates": serialisable,
-        }, ensure_ascii=False, default=str))
+        version = f"{time.time_ns():x}-{os.getpid()}"
+        version_dir = VOTER_CACHE_DIR / version
+        version_dir.mkdir(parents=True)
+        for key, values in columns.items():
+            if isinstance(values, _TextColumn):
+                np.save(version_dir / f"{key}.offsets.npy", values.offsets)
+                np.save(version_dir / f"{key}.utf8.npy", values.data)
+            else:
+                np.save(version_dir / f"{key}.npy", values)
+        (version_dir / VOTER_STATS_NAME).write_bytes(orjson.dumps(stats, default=str))
+        write_bytes_atomic(VOTER_CURRENT_PATH, version.encode())
+        for old in VOTER_CACHE_DIR.iterdir():
+            if old.name not in (version, VOTER_CURRENT_PATH.name):
+                if old.is_dir():
+                    shutil.rmtree(old, ignore_errors=True)
+                else:
+                    old.unlink(missing_ok=True)
         log.info("💾 Voter scores cached to disk")
     except Exception as exc:
         log.warning("Cache save failed: %s", exc)
 
 
+def current_voter_version() -> Optional[str]:
+    """Version directory CURRENT points at, or None if nothing is cached."""
+    try:
+        return VOTER_CURRENT_PATH.read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def read_voter_columns(version: str) -> Dict[str, Any]:
+    """Memory-map every cached column — no per-row Python objects are built."""
+    version_dir = VOTER_CACHE_DIR / version
+    columns: Dict[str, Any] = {
+        k: np.load(version_dir / f"{k}.npy", mmap_mode="r")
+        for k in _VOTER_STR_COLUMNS + tuple(_VOTER_NUM_COLUMNS)
+    }
+    for k in _VOTER_TEXT_COLUMNS:
+        columns[k] = _TextColumn(np.load(version_dir / f"{k}.offsets.npy", mmap_mode="r"),
+                                 np.load(version_dir / f"{k}.utf8.npy", mmap_mode="r"))
+    return columns
+
+
+def reload_scored_cache() -> None:
+    """Swap in the scored columns + stats of the version CURRENT names."""
+    global _voter_stats, _voter_cache_version
+    with _voter_reload_lock:
+        for attempt in range(3):
+            version = current_voter_version()
+            if version is None:
+                raise FileNotFoundError(VOTER_CURRENT_PATH)
+            try:
+                columns = read_voter_columns(version)
+                stats = orjson.loads((VOTER_CACHE_DIR / version / VOTER_STATS_NAME).read_bytes())
+                break
+            except FileNotFoundError:
+                # A newer save pruned this version mid-load — follow CURRENT again
+                if attempt == 2:
+                    raise
+        index_voter_columns(columns, version)
+        _voter_stats = stats
+        _voter_cache_version = version
+
+
+def refresh_voter_cache() -> None:
+    """
+    Reload when the cache on disk is newer than ours — a partial flush from a
+    running scorer, or a run started by another uvicorn worker.
+    """
+    try:
+        version = current_voter_version()
+        if version is not None and version != _voter_cache_version:
+            reload_scored_cache()
+    except (OSError, ValueError) as exc:
+        # Caught a writer mid-save — the next request retries
+        log.debug("Voter cache not ready: %s", exc)
+
+
 def load_voter_cache() -> bool:
     """Try loading previously scored voters from disk cache."""
-    global voter_records, scored_voters, _voter_stats
-    if not VOTER_CACHE_PATH.exists():
+    global voter_records
+    if current_voter_version() is None:
         return False
     if not VOTER_CSV_PATH.exists():
         return False
@@ -1521,21 +2719,120 @@ def load_voter_cache() -> bool:
         raw = VOTER_CSV_PATH.read_text(encoding="utf-8")
         voter_records = parse_voter_csv(raw)
         # Load scored results
-        cached = json.loads(VOTER_CACHE_PATH.read_text())
-        scored_voters = cached.get("candidates", [])
-        _voter_stats = cached.get("stats", {})
-        log.info("✅ Loaded %d scored voters from cache", len(scored_voters))
+        reload_scored_cache()
+        log.info("✅ Loaded %d scored voters from cache", scored_count())
         return True
     except Exception as exc:
         log.warning("Voter cache load failed: %s", exc)
         return False
 
 
+# ─── Scoring worker process ──────────────────────────────────────────────────
+# Scoring is CPU-bound Python; running it in a BackgroundTasks thread holds
+# the GIL and starves request handlers.  It runs in a child process instead,
+# which returns the columns + stats; the parent saves them to the on-disk voter
+# cache and publishes them (_scoring_done).
+
+_scoring_pool: Optional[ProcessPoolExecutor] = None
+_scoring_lock_fd: Optional[int] = None   # flock held for the whole run (cross-worker writer gate)
+_scoring_active_fd: Optional[int] = None   # flock on the separate file scoring_active probes
+VOTER_LOCK_PATH   = CACHE_DIR / "voter-scoring.lock"
+# Probed instead of the writer gate: a probe's momentary shared lock there would
+# make a concurrent claim's non-blocking exclusive lock fail with a spurious 409
+VOTER_ACTIVE_PATH = CACHE_DIR / "voter-scoring.active"
+
+
+def _get_scoring_pool() -> ProcessPoolExecutor:
+    """Lazy single-worker pool (created on first scoring request)."""
+    global _scoring_pool
+    if _scoring_pool is None:
+        # spawn, not fork: this process holds torch / OpenMP and executor
+        # threads, and forking a threaded process can deadlock the child
+        _scoring_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    return _scoring_pool
+
+
+def score_all_voters_worker() -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Child-process entry point: score the saved CSV; the columns + stats go back to the parent."""
+    return score_all_voters(parse_voter_csv(VOTER_CSV_PATH.read_text(encoding="utf-8")))
+
+
+def scoring_active() -> bool:
+    """True while this or any other uvicorn worker is scoring."""
+    if _voter_scoring:
+        return True
+    if fcntl is None:
+        return False
+    fd = os.open(VOTER_ACTIVE_PATH, os.O_RDWR | os.O_CREAT)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        return False
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)   # also drops the probe's shared lock
+
+
+def claim_scoring() -> None:
+    """Take the writer lock and mark scoring in progress; 409 if another run holds it."""
+    global _voter_scoring, _scoring_lock_fd, _scoring_active_fd
+    if _voter_scoring:
+        raise HTTPException(status_code=409, detail="Scoring already in progress")
+    if fcntl is not None:
+        fd = os.open(VOTER_LOCK_PATH, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise HTTPException(status_code=409, detail="Scoring already in progress")
+        _scoring_lock_fd = fd
+        # Blocking: with the writer gate held, only momentary probes can contend
+        _scoring_active_fd = os.open(VOTER_ACTIVE_PATH, os.O_RDWR | os.O_CREAT)
+        fcntl.flock(_scoring_active_fd, fcntl.LOCK_EX)
+    _voter_scoring = True
+
+
+def release_scoring() -> None:
+    """Clear the scoring flag and drop the writer lock."""
+    global _voter_scoring, _scoring_lock_fd, _scoring_active_fd
+    _voter_scoring = False
+    if _scoring_active_fd is not None:
+        os.close(_scoring_active_fd)   # closing drops its flock
+        _scoring_active_fd = None
+    if _scoring_lock_fd is not None:
+        fcntl.flock(_scoring_lock_fd, fcntl.LOCK_UN)
+        os.close(_scoring_lock_fd)
+        _scoring_lock_fd = None
+
+
+def _scoring_done(future: Future) -> None:
+    """Pool callback: save and publish the worker's result, then release the writer lock."""
+    try:
+        result = future.result()
+        if result is not None:
+            save_voter_cache(*result)
+            reload_scored_cache()
+    except Exception as exc:
+        log.error("Voter scoring failed: %s", exc)
+    finally:
+        release_scoring()
+
+
+def start_scoring() -> None:
+    """Hand a claimed scoring run (see claim_scoring) to the worker process."""
+    try:
+        future = _get_scoring_pool().submit(score_all_voters_worker)
+    except Exception:
+        release_scoring()
+        raise
+    future.add_done_callback(_scoring_done)
+
+
 # ─── Voter API Models ────────────────────────────────────────────────────────
 
 class VoterFilterRequest(BaseModel):
-    city: Optional[str] = None
-    precinct: Optional[str] = None
+    city: Optional[Union[str, List[str]]] = None       # one value or a multi-select list
+    precinct: Optional[Union[str, List[str]]] = None
     languages: Optional[List[str]] = None
     minAge: Optional[int] = None
     maxAge: Optional[int] = None
@@ -1551,13 +2848,13 @@ class VoterFilterRequest(BaseModel):
 # ─── Voter Routes ────────────────────────────────────────────────────────────
 
 @app.post("/upload-voters")
-async def upload_voters(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+async def upload_voters(file: UploadFile = File(...)):
     """
     Upload a voter registration CSV. Parses, validates, stores, and kicks off scoring.
     """
-    global voter_records, scored_voters, _voter_scoring
+    global voter_records
 
-    if _voter_scoring:
+    if scoring_active():
         raise HTTPException(status_code=409, detail="Scoring already in progress")
 
     if not file.filename or not file.filename.endswith(".csv"):
@@ -1566,28 +2863,23 @@ async def upload_voters(background_tasks: BackgroundTasks, file: UploadFile = Fi
     raw = (await file.read()).decode("utf-8")
 
     try:
-        voter_records = parse_voter_csv(raw)
+        records = parse_voter_csv(raw)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    if len(voter_records) == 0:
+    if len(records) == 0:
         raise HTTPException(status_code=400, detail="CSV contains no data rows")
 
+    # Hold the writer lock before touching the shared CSV
+    claim_scoring()
+    voter_records = records
+
     # Save raw CSV to disk for cache reload
     VOTER_CSV_PATH.write_text(raw, encoding="utf-8")
     log.info("📥 Uploaded %d voter records from %s", len(voter_records), file.filename)
 
-    # Kick off scoring in background
-    _voter_scoring = True
-
-    def _run_scoring():
-        global _voter_scoring
-        try:
-            score_all_voters()
-        finally:
-            _voter_scoring = False
-
-    background_tasks.add_task(_run_scoring)
+    # Kick off scoring in the worker process
+    start_scoring()
 
     return {
         "status": "upload_complete",
@@ -1597,112 +2889,130 @@ async def upload_voters(background_tasks: BackgroundTasks, file: UploadFile = Fi
     }
 
 
+def _etag_matches(request: Request, response: Response, etag: str) -> bool:
+    """Tag the response; True when the client's If-None-Match is current (answer 304)."""
+    response.headers["ETag"] = etag
+    return request.headers.get("if-none-match") == etag
+
+
+async def voter_filter(request: Request) -> VoterFilterRequest:
+    """
+    Parse the /score-voters body straight from bytes with pydantic-core's JSON
+    validator (skips FastAPI's json.loads → dict → validate round trip).
+    """
+    try:
+        return VoterFilterRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in exc.errors(include_url=False)]
+        )
+
+
+@lru_cache(maxsize=16)
+def _scoring_empty_body(page_size: int) -> bytes:
+    """Serialized "no results yet" page returned while the first scoring run is going."""
+    return orjson.dumps({
+        "candidates": [],
+        "totalScored": 0,
+        "totalFiltered": 0,
+        "page": 1,
+        "pageSize": page_size,
+        "totalPages": 0,
+        "scoring": True,
+    })
+
+
 @app.post("/score-voters")
-def score_voters_endpoint(req: VoterFilterRequest):
+def score_voters_endpoint(request: Request, response: Response, req: VoterFilterRequest = Depends(voter_filter)):
     """
     Return scored + filtered + paginated candidates.
     Filters are applied server-side for performance.
+    While scoring is running, serves the partial ranking the worker has flushed so far.
     """
-    if not scored_voters and not _voter_scoring:
+    refresh_voter_cache()
+    scoring = scoring_active()
+    if not scored_count() and not scoring:
         # Try loading from cache
         if not load_voter_cache():
             raise HTTPException(status_code=404, detail="No voter data uploaded yet. Upload a CSV first.")
+    view = _view   # one snapshot for the whole request
+
+    if scoring and not len(view.scores):
+        # The UI polls this every second until first results land — answer
+        # with prebuilt bytes, and a tag that holds for the whole window
+        etag = f'W/"scoring-{view.version}-{req.pageSize}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=_scoring_empty_body(req.pageSize),
+                        media_type="application/json", headers={"ETag": etag})
+
+    body_hash = hashlib.blake2b(req.model_dump_json().encode(), digest_size=8).hexdigest()
+    etag = f'W/"{view.version}-{int(scoring)}-{body_hash}"'
+    if _etag_matches(request, response, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    idx = _filtered_sorted_idx(
+        view,
+        _selected(req.city), _selected(req.precinct), tuple(req.languages or ()),
+        req.minAge, req.maxAge, req.minScore,
+        bool(req.experiencedOnly), bool(req.bilingualOnly),
+        req.sortBy, req.sortDir,
+    )
 
-    if _voter_scoring and not scored_voters:
-        return {
-            "candidates": [],
-            "totalScored": 0,
-            "totalFiltered": 0,
-            "page": 1,
-            "pageSize": req.pageSize,
-            "totalPages": 0,
-            "scoring": True,
-        }
-
-    # Apply filters
-    filtered = scored_voters
-    if req.city and req.city != "All":
-        filtered = [c for c in filtered if c["city"] == req.city]
-    if req.precinct and req.precinct != "All":
-        filtered = [c for c in filtered if c["precinct"] == req.precinct]
-    if req.languages:
-        filtered = [c for c in filtered if any(l in c["languages"] for l in req.languages)]
-    if req.minAge is not None:
-        filtered = [c for c in filtered if c["age"] >= req.minAge]
-    if req.maxAge is not None:
-        filtered = [c for c in filtered if c["age"] <= req.maxAge]
-    if req.minScore is not None:
-        filtered = [c for c in filtered if c["aiScore"] >= req.minScore]
-    if req.experiencedOnly:
-        filtered = [c for c in filtered if c["previousPollWorker"]]
-    if req.bilingualOnly:
-        filtered = [c for c in filtered if len(c["languages"]) > 1]
-
-    # Sort
-    reverse = req.sortDir == "desc"
-    if req.sortBy in ("aiScore", "age"):
-        filtered.sort(key=lambda c: c.get(req.sortBy, 0), reverse=reverse)
-    elif req.sortBy == "name":
-        filtered.sort(key=lambda c: c.get("name", "").lower(), reverse=reverse)
-    else:
-        filtered.sort(key=lambda c: c.get("aiScore", 0), reverse=True)
-
-    # Paginate
-    total_filtered = len(filtered)
-    total_pages = max(1, math.ceil(total_filtered / req.pageSize))
+    # Paginate — a pure slice of the cached ordering
+    total_filtered = len(idx)
+    total_pages = max(1, -(-total_filtered // req.pageSize))
     page = max(1, min(req.page, total_pages))
     start = (page - 1) * req.pageSize
     end = start + req.pageSize
-    page_candidates = filtered[start:end]
+    page_candidates = _page_rows(view, idx[start:end])
 
-    return {
+    # Returned as a Response so FastAPI skips its jsonable_encoder pass —
+    # everything here is already plain Python, straight into orjson
+    return ORJSONResponse({
         "candidates": page_candidates,
-        "totalScored": len(scored_voters),
+        "totalScored": len(view.scores),
         "totalFiltered": total_filtered,
         "page": page,
         "pageSize": req.pageSize,
         "totalPages": total_pages,
-        "scoring": _voter_scoring,
-    }
+        "scoring": scoring,
+    }, headers={"ETag": etag})
 
 
 @app.get("/voter-stats")
-def voter_stats_endpoint():
+def voter_stats_endpoint(request: Request, response: Response):
     """Return summary statistics for the uploaded voter dataset."""
-    if not _voter_stats and not scored_voters:
+    refresh_voter_cache()
+    scoring = scoring_active()
+    if not _voter_stats and not scored_count():
         if not load_voter_cache():
             return {
                 "loaded": False,
                 "totalRecords": 0,
-                "scoring": _voter_scoring,
+                "scoring": scoring,
             }
 
-    return {
-        "loaded": True,
-        "scoring": _voter_scoring,
+    etag = f'W/"{_view.version}-{int(scoring)}"'
+    if _etag_matches(request, response, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # Stats flushed mid-run carry "scoring": False — the live flag wins
+    return ORJSONResponse({
         **_voter_stats,
-    }
+        "loaded": True,
+        "scoring": scoring,
+    }, headers={"ETag": etag})
 
 
 @app.post("/rescore-voters")
-async def rescore_voters(background_tasks: BackgroundTasks):
+async def rescore_voters():
     """Force a full re-score of the current voter dataset."""
-    global _voter_scoring
-    if not voter_records:
+    if not voter_records and not load_voter_cache():
         raise HTTPException(status_code=404, detail="No voter data loaded. Upload a CSV first.")
-    if _voter_scoring:
-        raise HTTPException(status_code=409, detail="Scoring already in progress")
-
-    _voter_scoring = True
-
-    def _run():
-        global _voter_scoring
-        try:
-            score_all_voters()
-        finally:
-            _voter_scoring = False
 
-    background_tasks.add_task(_run)
+    claim_scoring()
+    start_scoring()
     return {"status": "rescoring", "totalRecords": len(voter_records)}
 
 
@@ -1715,5 +3025,19 @@ async def startup_voter_cache():
         log.info("📊 Voter dataset loaded from cache: %d records", len(voter_records))
 
 
+@app.on_event("shutdown")
+async def shutdown_scoring_pool():
+    """Stop the scoring worker process with the server."""
+    if _scoring_pool is not None:
+        _scoring_pool.shutdown(wait=False, cancel_futures=True)
+    if _ollama_client is not None:
+        _ollama_client.close()
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
+    if SIDECAR_WORKERS > 1:
+        # Multiple workers need an import string so each process builds its own app
+        uvicorn.run("main:app", app_dir=str(SIDECAR_DIR), host="127.0.0.1", port=8000,
+                    workers=SIDECAR_WORKERS, log_level="info")
+    else:
+        uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
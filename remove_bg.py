@@ -12,14 +12,12 @@ def remove_background(input_path, output_path, tolerance=30):
     img = Image.open(input_path).convert('RGBA')
     data = np.array(img)
     
-    # Get the alpha channel
-    r, g, b, a = data.T
-    
-    # Define white/light background threshold
-    white_areas = (r > 255 - tolerance) & (g > 255 - tolerance) & (b > 255 - tolerance)
+    # Define white/light background threshold: every RGB channel above it
+    # (compared in place on the H×W×4 array — no transposed copies)
+    white_areas = np.all(data[..., :3] > 255 - tolerance, axis=-1)
     
     # Make white areas transparent
-    data[..., 3][white_areas.T] = 0
+    data[..., 3][white_areas] = 0
     
     # Create new image with transparent background
     result = Image.fromarray(data)